@@ -0,0 +1,133 @@
+"""In-memory cache for idempotent GET responses.
+
+Entries are keyed by path, query parameters and request headers, expire after a TTL (or the server's
+`Cache-Control: max-age`), and keep the `ETag`/`Last-Modified` validators so an
+expired entry can be revalidated with a conditional request instead of re-downloaded.
+"""
+from __future__ import annotations
+import time as T
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Dict, Hashable, Optional
+import httpx
+
+
+@dataclass(slots=True)
+class CacheEntry:
+    """A decoded response body plus its freshness information.
+
+    Attributes:
+        body: Decoded JSON body.
+        expires_at: `time.monotonic()` deadline after which the entry must be revalidated.
+        etag: `ETag` returned by the server, if any.
+        last_modified: `Last-Modified` returned by the server, if any.
+        parsed: Values already parsed from `body` (e.g. validated models), by parser key.
+    """
+    body: Any
+    expires_at: float
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    parsed: Dict[Hashable, Any] = field(default_factory=dict)
+
+    def is_fresh(self) -> bool:
+        return T.monotonic() < self.expires_at
+
+    def validators(self) -> Dict[str, str]:
+        """Conditional request headers for revalidating this entry."""
+        headers: Dict[str, str] = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class ResponseCache:
+    """LRU + TTL cache of GET responses.
+
+    Honors `Cache-Control: no-store` (never stored), `no-cache` (always revalidated)
+    and `max-age` (caps the default TTL).
+    """
+
+    def __init__(self, ttl: float = 60.0, maxsize: int = 4096):
+        """Create the cache.
+
+        Args:
+            ttl: Default lifetime in seconds when the server sends no `max-age`.
+            maxsize: Maximum number of entries; the least recently used is evicted first.
+        """
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[Hashable, CacheEntry]" = OrderedDict()
+        # se incrementa en cada clear(); una respuesta pedida antes no se guarda
+        self.generation = 0
+
+    @staticmethod
+    def key(path: str, headers: Dict[str, str], params: Optional[Dict[str, str]] = None) -> Hashable:
+        return (path, tuple(sorted(params.items())) if params else (), tuple(sorted(headers.items())))
+
+    def get(self, key: Hashable) -> Optional[CacheEntry]:
+        """Return the entry for `key` (fresh or stale), or `None`."""
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+        return entry
+
+    def store(self, key: Hashable, response: httpx.Response, body: Any, generation: Optional[int] = None) -> None:
+        """Store a 200 response unless the server forbids it.
+
+        When `generation` is given and the cache was cleared since it was read,
+        the response is stale and is not stored.
+        """
+        if generation is not None and generation != self.generation:
+            return
+        ttl = self._ttl_for(response)
+        if ttl is None:
+            self._entries.pop(key, None)
+            return
+        self._entries[key] = CacheEntry(
+            body=body,
+            expires_at=T.monotonic() + ttl,
+            etag=response.headers.get("ETag"),
+            last_modified=response.headers.get("Last-Modified"),
+        )
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def revalidated(self, key: Hashable, entry: CacheEntry, response: httpx.Response, generation: Optional[int] = None) -> CacheEntry:
+        """Refresh `entry` after a `304 Not Modified` and return it.
+
+        When `generation` is given and the cache was cleared since it was read,
+        `entry` is returned without being put back in the cache.
+        """
+        if generation is not None and generation != self.generation:
+            return entry
+        ttl = self._ttl_for(response)
+        entry.expires_at = T.monotonic() + (ttl or 0.0)
+        entry.etag = response.headers.get("ETag", entry.etag)
+        entry.last_modified = response.headers.get("Last-Modified", entry.last_modified)
+        if ttl is None:
+            self._entries.pop(key, None)
+        else:
+            self._entries[key] = entry
+        return entry
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self.generation += 1
+
+    def _ttl_for(self, response: httpx.Response) -> Optional[float]:
+        """Lifetime allowed by the response's `Cache-Control`; `None` means do not store."""
+        directives = [d.strip() for d in response.headers.get("Cache-Control", "").lower().split(",")]
+        if "no-store" in directives:
+            return None
+        if "no-cache" in directives:
+            return 0.0
+        for directive in directives:
+            if directive.startswith("max-age="):
+                try:
+                    return min(self.ttl, float(directive[len("max-age="):]))
+                except ValueError:
+                    break
+        return self.ttl
@@ -11,6 +11,9 @@ Parses a choreography (see `schema.py`), creates/finds EventTypes, Rules, and Tr
 and ensures EventType⇄Trigger, Trigger⇄Rule, and optional Trigger⇄Trigger relations.
 """
 
+# Tipos de parámetro que acepta el backend para una Rule
+_ALLOWED_PARAM_TYPES = frozenset({"string", "int", "float", "bool"})
+
 class ChoreographyInterpreter:
     """Apply a choreography spec to the ShieldX backend.
 
@@ -221,10 +224,9 @@ class ChoreographyInterpreter:
             if found:
                 return Ok(found["id"])
 
-            allowed_types = {"string", "int", "float", "bool"}
             params: Dict[str, Dict[str, Any]] = {}
             for pname, pspec in (trig.rule.parameters or {}).items():
-                if pspec.type not in allowed_types:
+                if pspec.type not in _ALLOWED_PARAM_TYPES:
                     return Err(ValueError(f"Invalid parameter type '{pname}': '{pspec.type}'"))
                 params[pname] = {"type": pspec.type, "description": pspec.description or ""}
 
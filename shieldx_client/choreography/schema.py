@@ -1,6 +1,6 @@
 from __future__ import annotations
 from typing import Dict, List, Literal, Optional
-from pydantic import BaseModel, Field, model_validator
+from pydantic import BaseModel, ConfigDict, Field, model_validator
 """Pydantic models for the choreography YAML.
 
 Models:
@@ -11,6 +11,9 @@ Models:
 - ChoreographySpec: YAML root with basic validation.
 """
 
+# El esquema de validación se construye en el primer uso, no al importar
+_DEFERRED = ConfigDict(defer_build=True)
+
 ParamType = Literal["string", "int", "float", "bool", "json"]  # 'json' lo mapeamos si quieres permitirlo
 
 """Allowed parameter types for a Rule.
@@ -28,6 +31,7 @@ class ParameterSpec(BaseModel):
         required: Whether the parameter is required (default: True).
         default: Optional default value.
     """
+    model_config = _DEFERRED
     type: ParamType
     description: Optional[str] = None
     required: bool = True
@@ -40,6 +44,7 @@ class RuleRef(BaseModel):
         target: Target function/action identifier.
         parameters: Mapping of parameter name to `ParameterSpec`.
     """
+    model_config = _DEFERRED
     target: str
     parameters: Dict[str, ParameterSpec] = Field(default_factory=dict)
 
@@ -51,6 +56,7 @@ class TriggerSpec(BaseModel):
         rule: Rule to execute when the trigger fires.
         event_types: Optional list of Event Type names to bind; if empty, `name` is used.
     """
+    model_config = _DEFERRED
     name: str
     rule: RuleRef
     # M:N con EventTypes (si no lo pones, se usa name como event_type)
@@ -65,6 +71,7 @@ class LinkSpec(BaseModel):
         order: Optional execution order.
         condition: Optional condition expression.
     """
+    model_config = _DEFERRED
     from_trigger: str = Field(alias="from")
     to_trigger: str = Field(alias="to")
     order: Optional[int] = None
@@ -79,6 +86,7 @@ class ChoreographySpec(BaseModel):
         triggers: List of triggers (required; must not be empty).
         links: Optional trigger chaining definitions.
     """
+    model_config = _DEFERRED
     policy_id: Optional[str] = None
     version: Optional[str] = None
     triggers: List[TriggerSpec]
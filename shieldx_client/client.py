@@ -1,18 +1,44 @@
+import functools
+import warnings
 import httpx
-import json
+import logging
+import orjson
+try:
+    import ormsgpack
+except ImportError:  # extra opcional "msgpack"
+    ormsgpack = None
 import time as T
-from pydantic import BaseModel
-from typing import Optional, Dict, Any,TypeVar,Type,List
+from pydantic import BaseModel, TypeAdapter
+from typing import Optional, Dict, Any,TypeVar,Type,List,Callable,Awaitable,Hashable
 from shieldx_client.log.logger_config import get_logger
 from option import Result,Ok,Err
 from pathlib import Path
 import shieldx_core.dtos as DTOS
-from shieldx_client.choreography.interpreter import ChoreographyInterpreter
+from shieldx_client.cache import ResponseCache
 import asyncio
 
 L =  get_logger(name="shieldx-client")
 R = TypeVar(name="R", bound=BaseModel)
 
+HTTP_TIMEOUT = httpx.Timeout(10.0, connect=5.0)
+MSGPACK_MEDIA_TYPE = "application/msgpack"
+
+
+def _as_result(fn):
+    """Return `Err(e)` for any exception raised by the decorated coroutine.
+
+    Client methods already return a `Result`; this replaces the per-method
+    `try: ... except Exception as e: return Err(e)` boilerplate.
+    """
+    @functools.wraps(fn)
+    async def wrapper(*args, **kwargs):
+        try:
+            return await fn(*args, **kwargs)
+        except Exception as e:
+            return Err(e)
+    return wrapper
+
+
 """Async HTTP client for the ShieldX API.
 
 Provides CRUD for:
@@ -25,18 +51,56 @@ and `unwrap_err` instead of catching exceptions in normal flows.
 class ShieldXClient:
     """Client for interacting with the ShieldX backend.
 
-    Manages shared headers, Pydantic serialization/validation, and basic logging.
+    Manages shared headers, a pooled HTTP connection, Pydantic serialization/validation,
+    and basic logging. Use it as an async context manager (or call `aclose`) to release
+    the pooled connections.
+
+    An instance belongs to one event loop at a time: its pool is opened on the loop
+    of the first request. To reuse it under another loop (e.g. successive
+    `asyncio.run()` calls), `aclose` it before the first loop ends; otherwise the
+    old pool is abandoned and a `ResourceWarning` is emitted.
 
     Attributes:
         base_url: Base API URL (without a trailing slash).
         headers: Default headers (JSON and optional Authorization).
     """
-    def __init__(self, base_url: str, token: Optional[str] = None):
+    _list_adapters: Dict[type, TypeAdapter] = {}
+
+    def __init__(self, base_url: str, token: Optional[str] = None, *,
+                 max_connections: int = 200, max_keepalive_connections: int = 100, keepalive_expiry: Optional[float] = 5.0,
+                 max_concurrency: int = 64, cache_ttl: Optional[float] = None, binary: bool = False, http2: bool = False,
+                 transport: Optional[httpx.AsyncBaseTransport] = None):
         """Initialize the client.
 
         Args:
             base_url: e.g. "http://localhost:20000/api/v1".
             token: Optional Bearer token added as `Authorization: Bearer <token>`.
+            max_connections: Upper bound of concurrent connections in the pool.
+            max_keepalive_connections: Idle connections kept open for reuse.
+                Size both to the expected fan-out of `asyncio.gather` callers so
+                bulk operations do not queue on the pool.
+            keepalive_expiry: Seconds an idle connection is kept before it is closed
+                (`None` keeps it indefinitely). Raise it when calls are spaced out
+                so they still find a warm connection.
+            max_concurrency: Maximum number of requests in flight at once. Extra
+                requests (e.g. from a large `asyncio.gather`) wait for a free slot
+                instead of piling onto the pool.
+            cache_ttl: When set, GET responses are cached for this many seconds
+                (bounded by the server's `Cache-Control`). Any POST/PUT/DELETE sent
+                through this client clears the cache, and GETs already in flight
+                when it does are not stored. The validated models are
+                cached with the response and shared between callers, so treat
+                them as read-only. Disabled by default.
+            binary: When True, ask the server for MessagePack responses
+                (`Accept: application/msgpack`), falling back to JSON if it does not
+                support them. Request bodies are always JSON. Requires the `msgpack`
+                extra (`ormsgpack`).
+            http2: When True, negotiate HTTP/2 (TLS ALPN) so concurrent requests are
+                multiplexed over a single connection. Plain `http://` URLs keep using
+                HTTP/1.1. Requires the `http2` extra (`h2`).
+            transport: Optional httpx transport used instead of the network one
+                (e.g. `httpx.MockTransport` in unit tests). The connection limits and
+                `http2` only apply to the default transport.
 
         Note:
             `base_url` is normalized to not end with a slash.
@@ -47,7 +111,75 @@ class ShieldXClient:
         }
         if token:
             self.headers["Authorization"] = f"Bearer {token}"
-
+        if binary:
+            if ormsgpack is None:
+                raise ImportError("binary=True requires the 'msgpack' extra: pip install shieldx-client[msgpack]")
+            self.headers["Accept"] = f"{MSGPACK_MEDIA_TYPE}, application/json;q=0.9"
+        if http2:
+            try:
+                import h2  # noqa: F401
+            except ImportError:
+                raise ImportError("http2=True requires the 'http2' extra: pip install shieldx-client[http2]")
+        self.http2 = http2
+        self._transport = transport
+        if max_concurrency < 1:
+            raise ValueError(f"max_concurrency must be >= 1, got {max_concurrency}")
+        self._max_concurrency = max_concurrency
+        self._limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+        self._cache = ResponseCache(ttl=cache_ttl) if cache_ttl else None
+        self._client: Optional[httpx.AsyncClient] = None
+        self._client_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._sem: Optional[asyncio.Semaphore] = None
+
+    def _http(self) -> httpx.AsyncClient:
+        """Return the pooled `httpx.AsyncClient` for the running event loop.
+
+        The client is created lazily and reused across requests so TCP connections
+        are kept alive. httpx pools are bound to the loop that opened them, so a new
+        client (and its concurrency semaphore) is created when the running loop changes.
+        An unclosed client from another loop cannot be closed from this one; it is
+        dropped with a `ResourceWarning`.
+        """
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._client_loop is not loop:
+            if self._client is not None and not self._client.is_closed:
+                warnings.warn(
+                    "ShieldXClient reused under a new event loop without aclose(); "
+                    "the connection pool opened on the previous loop was abandoned. "
+                    "Use 'async with ShieldXClient(...)' or await aclose() before the loop ends.",
+                    ResourceWarning,
+                    stacklevel=3,
+                )
+                L.warning({"event": "CLIENT.LOOP_CHANGED_WITHOUT_ACLOSE", "base_url": self.base_url})
+            self._client = httpx.AsyncClient(
+                base_url=self.base_url,
+                headers=self.headers,
+                limits=self._limits,
+                timeout=HTTP_TIMEOUT,
+                http2=self.http2,
+                transport=self._transport,
+            )
+            self._sem = asyncio.Semaphore(self._max_concurrency)
+            self._client_loop = loop
+        return self._client
+
+    async def aclose(self) -> None:
+        """Close the pooled HTTP connections."""
+        if self._client is not None:
+            await self._client.aclose()
+        self._client = None
+        self._client_loop = None
+        self._sem = None
+
+    async def __aenter__(self) -> "ShieldXClient":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
 
     def interpret(self, choreography_path_or_text: str, *, as_text: bool = False) -> Result[Dict[str, Any], Exception]:
         """Interpret a choreography YAML and index entities (blocking).
@@ -73,8 +205,13 @@ class ShieldXClient:
             ValueError: If the YAML does not match the schema.
         """
         async def _runner(yaml_text: str) -> Result[Dict[str, Any], Exception]:
+            from shieldx_client.choreography.interpreter import ChoreographyInterpreter
             interpreter = ChoreographyInterpreter(self)
-            return await interpreter.index_from_text(yaml_text)
+            try:
+                return await interpreter.index_from_text(yaml_text)
+            finally:
+                # el loop de asyncio.run muere aquí, junto con sus conexiones
+                await self.aclose()
         try:
             if as_text:
                 yaml_text = choreography_path_or_text
@@ -93,6 +230,7 @@ class ShieldXClient:
 
     
 
+    @_as_result
     async def interpret_async(self, choreography_path_or_text: str, *, as_text: bool = False) -> Result[Dict[str, Any], Exception]:
         """Interpret a choreography YAML and index entities (async).
 
@@ -103,21 +241,21 @@ class ShieldXClient:
         Returns:
             Same structure as `interpret`.
         """
-        try:
-            if as_text:
-                yaml_text = choreography_path_or_text
-            else:
-                p = Path(choreography_path_or_text)
-                if not p.exists():
-                    raise FileNotFoundError(f"File not found: {p}")
-                yaml_text = p.read_text(encoding="utf-8")
-            interpreter = ChoreographyInterpreter(self)
-            return await interpreter.index_from_text(yaml_text)
-        except Exception as e:
-            return Err(e)
+        if as_text:
+            yaml_text = choreography_path_or_text
+        else:
+            p = Path(choreography_path_or_text)
+            if not p.exists():
+                raise FileNotFoundError(f"File not found: {p}")
+            yaml_text = p.read_text(encoding="utf-8")
+        # import diferido: PyYAML y el esquema solo se cargan si se interpreta algo
+        from shieldx_client.choreography.interpreter import ChoreographyInterpreter
+        interpreter = ChoreographyInterpreter(self)
+        return await interpreter.index_from_text(yaml_text)
 
 # --- Events ---
-    async def create_event(self, event: DTOS.EventCreateDTO, headers: Dict[str, str] = {}) -> Result[DTOS.MessageWithIDDTO, Exception]:
+    @_as_result
+    async def create_event(self, event: DTOS.EventCreateDTO, headers: Optional[Dict[str, str]] = None) -> Result[DTOS.MessageWithIDDTO, Exception]:
         """Create a new Event.
 
         Args:
@@ -127,14 +265,12 @@ class ShieldXClient:
         Returns:
             Result with `MessageWithIDDTO` (contains message and created event `id`).
         """
-        try:
-            payload = json.loads(event.model_dump_json(by_alias=True))
-            result = await self._post("/events", payload, model=DTOS.MessageWithIDDTO, operation="CREATE_EVENT", headers=headers)
-            return result
-        except Exception as e:
-            return Err(e)
+        payload = event.model_dump_json(by_alias=True).encode()
+        result = await self._post("/events", payload, model=DTOS.MessageWithIDDTO, operation="CREATE_EVENT", headers=headers)
+        return result
 
-    async def get_all_events(self, headers: Dict[str, str] = {}) -> Result[List[DTOS.EventResponseDTO], Exception]:
+    @_as_result
+    async def get_all_events(self, headers: Optional[Dict[str, str]] = None) -> Result[List[DTOS.EventResponseDTO], Exception]:
         """List all Events.
 
         Args:
@@ -143,12 +279,10 @@ class ShieldXClient:
         Returns:
             Result with a list of `EventResponseDTO`.
         """
-        try:
-            return await self._get("/events", model=DTOS.EventResponseDTO, operation="GET_ALL_EVENTS", headers=headers, is_list=True)
-        except Exception as e:
-            return Err(e)
+        return await self._get_list("/events", model=DTOS.EventResponseDTO, operation="GET_ALL_EVENTS", headers=headers)
 
-    async def get_events_by_service(self, service_id: str, headers: Dict[str, str] = {}) -> Result[List[DTOS.EventResponseDTO], Exception]:
+    @_as_result
+    async def get_events_by_service(self, service_id: str, headers: Optional[Dict[str, str]] = None) -> Result[List[DTOS.EventResponseDTO], Exception]:
         """Filter Events by `service_id` (query parameter).
 
         Args:
@@ -158,21 +292,34 @@ class ShieldXClient:
         Returns:
             Result with a list of `EventResponseDTO`.
         """
-        try:
-            result = await self._get(f"/events?service_id={service_id}", model=DTOS.EventResponseDTO, operation="GET_EVENTS_BY_SERVICE", headers=headers, is_list=True)
-            return result
-        except Exception as e:
-            return Err(e)
+        result = await self._get_list("/events", model=DTOS.EventResponseDTO, operation="GET_EVENTS_BY_SERVICE", headers=headers, params={"service_id": service_id})
+        return result
+
+    @_as_result
+    async def count_events_by_service(self, service_id: str, headers: Optional[Dict[str, str]] = None) -> Result[int, Exception]:
+        """Count the Events of a `service_id` without validating them.
+
+        Sends the same request as `get_events_by_service` (and shares its cache
+        entry) but only returns the length of the decoded array.
+
+        Args:
+            service_id: Service identifier.
+            headers: Optional extra headers.
+
+        Returns:
+            Result with the number of Events (`TypeError` if the body is not a list).
+        """
+        events = await self._get_json("/events", operation="COUNT_EVENTS_BY_SERVICE", headers=headers, params={"service_id": service_id})
+        return Ok(self._array_len(events))
 
-    async def get_events_by_service_path(self, service_id: str, headers: Dict[str, str] = {})  -> Result[List[DTOS.EventResponseDTO], Exception]:
+    @_as_result
+    async def get_events_by_service_path(self, service_id: str, headers: Optional[Dict[str, str]] = None)  -> Result[List[DTOS.EventResponseDTO], Exception]:
         """Filtra eventos por ID de servicio (como path param)."""
-        try:
-            result = await self._get(f"/events/service/{service_id}", model=DTOS.EventResponseDTO, operation="GET_EVENTS_BY_SERVICE_PATH", headers=headers, is_list=True)
-            return result
-        except Exception as e:
-            return Err(e)
+        result = await self._get_list(f"/events/service/{service_id}", model=DTOS.EventResponseDTO, operation="GET_EVENTS_BY_SERVICE_PATH", headers=headers)
+        return result
 
-    async def get_events_by_microservice(self, microservice_id: str, headers: Dict[str, str] = {})  -> Result[List[DTOS.EventResponseDTO], Exception]:
+    @_as_result
+    async def get_events_by_microservice(self, microservice_id: str, headers: Optional[Dict[str, str]] = None)  -> Result[List[DTOS.EventResponseDTO], Exception]:
         """Filter Events by `microservice_id`.
 
         Args:
@@ -182,13 +329,11 @@ class ShieldXClient:
         Returns:
             Result with a list of `EventResponseDTO`.
         """
-        try:
-            result = await self._get(f"/events/microservice/{microservice_id}", model=DTOS.EventResponseDTO, operation="GET_EVENTS_BY_MICROSERVICE", headers=headers, is_list=True)
-            return result
-        except Exception as e:
-            return Err(e)
+        result = await self._get_list(f"/events/microservice/{microservice_id}", model=DTOS.EventResponseDTO, operation="GET_EVENTS_BY_MICROSERVICE", headers=headers)
+        return result
 
-    async def get_events_by_function(self, function_id: str, headers: Dict[str, str] = {})  -> Result[List[DTOS.EventResponseDTO], Exception]:
+    @_as_result
+    async def get_events_by_function(self, function_id: str, headers: Optional[Dict[str, str]] = None)  -> Result[List[DTOS.EventResponseDTO], Exception]:
         """Filter Events by `function_id`.
 
         Args:
@@ -198,13 +343,11 @@ class ShieldXClient:
         Returns:
             Result with a list of `EventResponseDTO`.
         """
-        try:
-            result = await self._get(f"/events/function/{function_id}", model=DTOS.EventResponseDTO, operation="GET_EVENTS_BY_FUNCTION", headers=headers, is_list=True)
-            return result
-        except Exception as e:
-            return Err(e)
+        result = await self._get_list(f"/events/function/{function_id}", model=DTOS.EventResponseDTO, operation="GET_EVENTS_BY_FUNCTION", headers=headers)
+        return result
 
-    async def get_event_by_id(self, event_id: str, headers: Dict[str,str] = {}) ->  Result[DTOS.EventResponseDTO, Exception]:
+    @_as_result
+    async def get_event_by_id(self, event_id: str, headers: Optional[Dict[str, str]] = None) ->  Result[DTOS.EventResponseDTO, Exception]:
         """Get an Event by ID.
 
         Args:
@@ -214,13 +357,35 @@ class ShieldXClient:
         Returns:
             Result with `EventResponseDTO`.
         """
-        try:
-            result = await self._get(f"/events/{event_id}", model=DTOS.EventResponseDTO,operation="GET_EVENT_BY_ID", headers=headers)
-            return result
-        except Exception as e:
-            return Err(e)
+        self._require_id("event_id", event_id)
+        result = await self._get(f"/events/{event_id}", model=DTOS.EventResponseDTO,operation="GET_EVENT_BY_ID", headers=headers)
+        return result
+
+    @_as_result
+    async def get_events_bulk(self, event_ids: List[str], headers: Optional[Dict[str, str]] = None) -> Result[List[DTOS.EventResponseDTO], Exception]:
+        """Get several Events by ID concurrently.
+
+        All lookups are in flight at once; with `http2=True` they share one
+        multiplexed connection.
+
+        Args:
+            event_ids: Event identifiers.
+            headers: Optional extra headers.
+
+        Returns:
+            Result with the `EventResponseDTO`s in the same order as `event_ids`,
+            or the first error found.
+        """
+        results = await asyncio.gather(*(self.get_event_by_id(i, headers=headers) for i in event_ids))
+        events: List[DTOS.EventResponseDTO] = []
+        for res in results:
+            if res.is_err:
+                return Err(res.unwrap_err())
+            events.append(res.unwrap())
+        return Ok(events)
 
-    async def update_event(self, event_id: str, data: DTOS.EventUpdateDTO, headers: Dict[str, str] = {}) -> Result[DTOS.EventResponseDTO, Exception]:
+    @_as_result
+    async def update_event(self, event_id: str, data: DTOS.EventUpdateDTO, headers: Optional[Dict[str, str]] = None) -> Result[DTOS.EventResponseDTO, Exception]:
         """Update an Event.
 
         Args:
@@ -231,14 +396,12 @@ class ShieldXClient:
         Returns:
             Result with the updated `EventResponseDTO`.
         """
-        try:
-            payload = json.loads(data.model_dump_json(by_alias=True, exclude_none=True))
-            result = await self._put(f"/events/{event_id}", payload, model=DTOS.EventResponseDTO, operation="UPDATE_EVENT", headers=headers)
-            return result
-        except Exception as e:
-            return Err(e)
+        payload = data.model_dump_json(by_alias=True, exclude_none=True).encode()
+        result = await self._put(f"/events/{event_id}", payload, model=DTOS.EventResponseDTO, operation="UPDATE_EVENT", headers=headers)
+        return result
 
-    async def delete_event(self, event_id: str, headers: Dict[str, str] = {}) -> Result[bool, Exception]:
+    @_as_result
+    async def delete_event(self, event_id: str, headers: Optional[Dict[str, str]] = None) -> Result[bool, Exception]:
         """Delete an Event by ID.
 
         Args:
@@ -248,15 +411,13 @@ class ShieldXClient:
         Returns:
             Result with `True` if the deletion succeeded.
         """
-        try:
-            await self._delete(f"/events/{event_id}",operation="DELETE_EVENT", headers= headers)
-            return Ok(True)
-        except Exception as e:
-            return Err(e)
+        result = await self._delete(f"/events/{event_id}",operation="DELETE_EVENT", headers= headers)
+        return result.map(lambda _: True)
 
 # ---Events Types---
 
-    async def create_event_type(self, event_type: DTOS.EventTypeCreateDTO, headers: Dict[str, str] = {}) -> Result[DTOS.MessageWithIDDTO,Exception]:
+    @_as_result
+    async def create_event_type(self, event_type: DTOS.EventTypeCreateDTO, headers: Optional[Dict[str, str]] = None) -> Result[DTOS.MessageWithIDDTO,Exception]:
         """Create an Event Type.
 
         Args:
@@ -266,13 +427,11 @@ class ShieldXClient:
         Returns:
             Result with `MessageWithIDDTO` (created id).
         """
-        try:
-            payload = event_type.model_dump()
-            result = await self._post(f"/event-types", payload=payload,model=DTOS.MessageWithIDDTO, operation="CREATE_EVENT_TYPE", headers=headers)
-            return result
-        except Exception as e:
-            return Err(e)
+        payload = event_type.model_dump_json().encode()
+        result = await self._post(f"/event-types", payload=payload,model=DTOS.MessageWithIDDTO, operation="CREATE_EVENT_TYPE", headers=headers)
+        return result
 
+    @_as_result
     async def find_event_type_by_name_dict(self, event_type: str) -> Result[Optional[dict], Exception]:
         """Find an Event Type by name.
 
@@ -282,16 +441,14 @@ class ShieldXClient:
         Returns:
             Dict `{"id": str, "event_type": str}` if found, otherwise `None`.
         """
-        try:
-            res = await self.list_event_types()
-            if res.is_ok:
-                for dto in res.unwrap():
-                    if dto.event_type == event_type:
-                        return Ok({"id": dto.event_type_id, "event_type": dto.event_type})
-                return Ok(None)
-        except Exception as e:
-            return Err(e)
+        res = await self.list_event_types()
+        if res.is_ok:
+            for dto in res.unwrap():
+                if dto.event_type == event_type:
+                    return Ok({"id": dto.event_type_id, "event_type": dto.event_type})
+            return Ok(None)
 
+    @_as_result
     async def create_event_type_dict(self, event_type_name: str) -> Result[dict, Exception]:
         """Create an Event Type and return a simple dict.
 
@@ -301,18 +458,16 @@ class ShieldXClient:
         Returns:
             Dict `{"id": str, "event_type": str}`.
         """
-        try:
-            req = DTOS.EventTypeCreateDTO(event_type=event_type_name)
-            res = await self.create_event_type(req)
-            if res.is_err:
-                return Err(res.unwrap_err())
-            msg = res.unwrap()  # MessageWithIDDTO
-            return Ok({"id": msg.id, "event_type": event_type_name})
-        except Exception as e:
-            return Err(e)
+        req = DTOS.EventTypeCreateDTO(event_type=event_type_name)
+        res = await self.create_event_type(req)
+        if res.is_err:
+            return Err(res.unwrap_err())
+        msg = res.unwrap()  # MessageWithIDDTO
+        return Ok({"id": msg.id, "event_type": event_type_name})
         
 
-    async def list_event_types(self, headers: Dict[str, str] = {}) -> Result[List[DTOS.EventTypeResponseDTO],Exception]:
+    @_as_result
+    async def list_event_types(self, headers: Optional[Dict[str, str]] = None) -> Result[List[DTOS.EventTypeResponseDTO],Exception]:
         """List all Event Types.
 
         Args:
@@ -321,14 +476,37 @@ class ShieldXClient:
         Returns:
             Result with a list of `EventTypeResponseDTO`.
         """
-        try:
-            data = await self._get(path = "/event-types", model=DTOS.EventTypeResponseDTO, operation="LIST_EVENT_TYPES", headers=headers,is_list=True)
-            return data
-            # return [EventTypeModel(**et) for et in data]
-        except Exception as e:
-            return Err(e)
+        data = await self._get_list(path = "/event-types", model=DTOS.EventTypeResponseDTO, operation="LIST_EVENT_TYPES", headers=headers)
+        return data
+        # return [EventTypeModel(**et) for et in data]
+
+    @_as_result
+    async def list_event_types_with_triggers(self, headers: Optional[Dict[str, str]] = None) -> Result[List[Dict[str, Any]], Exception]:
+        """List all Event Types together with their linked Triggers.
+
+        The per-type trigger lookups run concurrently instead of one after another.
+
+        Args:
+            headers: Optional extra headers.
 
-    async def get_event_type_by_id(self, event_type_id: str, headers: Dict[str, str] = {}) -> Result[DTOS.EventTypeResponseDTO, Exception]:
+        Returns:
+            Result with a list of `{"event_type": EventTypeResponseDTO, "triggers": List[EventsTriggersDTO]}`,
+            or the first error found.
+        """
+        res = await self.list_event_types(headers=headers)
+        if res.is_err:
+            return Err(res.unwrap_err())
+        event_types = res.unwrap()
+        results = await asyncio.gather(*(self.list_triggers_for_event_type(et.event_type_id, headers=headers) for et in event_types))
+        fused: List[Dict[str, Any]] = []
+        for et, triggers in zip(event_types, results):
+            if triggers.is_err:
+                return Err(triggers.unwrap_err())
+            fused.append({"event_type": et, "triggers": triggers.unwrap()})
+        return Ok(fused)
+
+    @_as_result
+    async def get_event_type_by_id(self, event_type_id: str, headers: Optional[Dict[str, str]] = None) -> Result[DTOS.EventTypeResponseDTO, Exception]:
         """Get an Event Type by ID.
 
         Args:
@@ -341,13 +519,12 @@ class ShieldXClient:
         #data = await self._get(f"/event-types/{event_type_id}", headers)
         #return EventTypeModel(**data)
 
-        try:
-            result = await self._get(f"/event-types/{event_type_id}", model=DTOS.EventTypeResponseDTO, operation="GET_EVENT_TYPE_BY_ID", headers=headers)
-            return result
-        except Exception as e:
-            return Err(e)
+        self._require_id("event_type_id", event_type_id)
+        result = await self._get(f"/event-types/{event_type_id}", model=DTOS.EventTypeResponseDTO, operation="GET_EVENT_TYPE_BY_ID", headers=headers)
+        return result
 
-    async def delete_event_type(self, event_type_id: str, headers: Dict[str, str] = {}) -> Result[bool, Exception]:
+    @_as_result
+    async def delete_event_type(self, event_type_id: str, headers: Optional[Dict[str, str]] = None) -> Result[bool, Exception]:
         """Delete an Event Type by ID.
 
         Args:
@@ -357,13 +534,11 @@ class ShieldXClient:
         Returns:
             Result with `True` if the deletion succeeded.
         """
-        try:
-            await self._delete(f"/event-types/{event_type_id}",operation="DELETE_EVENT_TYPE", headers=headers)
-            return Ok(True)
-        except Exception as e:
-            return Err(e)
+        result = await self._delete(f"/event-types/{event_type_id}",operation="DELETE_EVENT_TYPE", headers=headers)
+        return result.map(lambda _: True)
     # --- Relaciones EventType ⇄ Trigger ---
 
+    @_as_result
     async def is_trigger_bound_to_event_type_bool(self, event_type_id: str, trigger_id: str) -> Result[bool, Exception]:
         """Check whether a Trigger is bound to an Event Type.
 
@@ -374,14 +549,12 @@ class ShieldXClient:
         Returns:
             True if the relation exists; otherwise False.
         """
-        try:
-            res = await self.list_triggers_for_event_type(event_type_id)
-            if res.is_err:
-                return Err(res.unwrap_err())
-            return Ok(any(link.trigger_id == trigger_id for link in res.unwrap()))
-        except Exception as e:
-            return Err(e)
+        res = await self.list_triggers_for_event_type(event_type_id)
+        if res.is_err:
+            return Err(res.unwrap_err())
+        return Ok(any(link.trigger_id == trigger_id for link in res.unwrap()))
 
+    @_as_result
     async def bind_event_type_to_trigger_dict(self, event_type_id: str, trigger_id: str)  -> Result[dict, Exception]:
         """Bind a Trigger to an Event Type.
 
@@ -392,15 +565,13 @@ class ShieldXClient:
         Returns:
             Dict `{"event_type_id": str, "trigger_id": str}`.
         """
-        try:
-            res = await self.link_trigger_to_event_type(event_type_id, trigger_id)
-            if res.is_err:
-                return Err(res.unwrap_err())
-            return Ok({"event_type_id": event_type_id, "trigger_id": trigger_id})
-        except Exception as e:
-            return Err(e)
+        res = await self.link_trigger_to_event_type(event_type_id, trigger_id)
+        if res.is_err:
+            return Err(res.unwrap_err())
+        return Ok({"event_type_id": event_type_id, "trigger_id": trigger_id})
 
-    async def link_trigger_to_event_type(self, event_type_id: str, trigger_id: str, headers: Dict[str, str] = {}) -> Result[bool, Exception]:
+    @_as_result
+    async def link_trigger_to_event_type(self, event_type_id: str, trigger_id: str, headers: Optional[Dict[str, str]] = None) -> Result[bool, Exception]:
         """Create the EventType⇄Trigger relation.
 
         Args:
@@ -411,13 +582,30 @@ class ShieldXClient:
         Returns:
             Result with `True` if the link was created.
         """
-        try:
-            await self._post(f"/event-types/{event_type_id}/triggers/{trigger_id}", payload={}, model=None,operation="LINK_TRIGGER_TO_EVENT_TYPE", headers=headers)
-            return Ok(True)
-        except Exception as e:
-            return Err(e)
+        result = await self._post(f"/event-types/{event_type_id}/triggers/{trigger_id}", payload={}, model=None,operation="LINK_TRIGGER_TO_EVENT_TYPE", headers=headers)
+        return result.map(lambda _: True)
         
-    async def list_triggers_for_event_type(self, event_type_id: str, headers: Dict[str, str] = {})-> Result[List[DTOS.EventsTriggersDTO], Exception]:
+    @_as_result
+    async def link_triggers_to_event_type(self, event_type_id: str, trigger_ids: List[str], batch_size: int = 16, headers: Optional[Dict[str, str]] = None) -> Result[bool, Exception]:
+        """Create the EventType⇄Trigger relation for several Triggers.
+
+        Links are sent concurrently in batches of `batch_size` requests.
+
+        Args:
+            event_type_id: Event Type ID.
+            trigger_ids: Trigger IDs to link.
+            batch_size: Maximum number of link requests in flight at once.
+            headers: Optional extra headers.
+
+        Returns:
+            Result with `True` if every link was created, otherwise the first error.
+        """
+        return await self._link_in_batches(
+            lambda trigger_id: self.link_trigger_to_event_type(event_type_id, trigger_id, headers=headers),
+            trigger_ids, batch_size)
+
+    @_as_result
+    async def list_triggers_for_event_type(self, event_type_id: str, headers: Optional[Dict[str, str]] = None)-> Result[List[DTOS.EventsTriggersDTO], Exception]:
         """List Triggers bound to an Event Type.
 
         Args:
@@ -427,12 +615,10 @@ class ShieldXClient:
         Returns:
             Result with a list of `EventsTriggersDTO`.
         """
-        try:
-            return await self._get(f"/event-types/{event_type_id}/triggers",model=DTOS.EventsTriggersDTO,operation="LIST_TRIGGERS_FOR_EVENT_TYPE", headers=headers,is_list=True)
-        except Exception as e:
-            return Err(e)    
+        return await self._get_list(f"/event-types/{event_type_id}/triggers",model=DTOS.EventsTriggersDTO,operation="LIST_TRIGGERS_FOR_EVENT_TYPE", headers=headers)
 
-    async def replace_triggers_for_event_type(self, event_type_id: str, trigger_ids: list[str], headers: Dict[str, str] = {}) -> Result[bool, Exception]:
+    @_as_result
+    async def replace_triggers_for_event_type(self, event_type_id: str, trigger_ids: list[str], headers: Optional[Dict[str, str]] = None) -> Result[bool, Exception]:
         """Replace all Triggers bound to an Event Type.
 
         Args:
@@ -443,13 +629,11 @@ class ShieldXClient:
         Returns:
             Result with `True` if the replacement succeeded.
         """
-        try:
-            await self._put(f"/event-types/{event_type_id}/triggers", payload=trigger_ids, model=None, operation="REPLACE_TRIGGERS_FOR_EVENT_TYPE", headers=headers)
-            return Ok(True)
-        except Exception as e:
-            return Err(e)
+        result = await self._put(f"/event-types/{event_type_id}/triggers", payload=trigger_ids, model=None, operation="REPLACE_TRIGGERS_FOR_EVENT_TYPE", headers=headers)
+        return result.map(lambda _: True)
 
-    async def unlink_trigger_from_event_type(self, event_type_id: str, trigger_id: str, headers: Dict[str, str] = {}) -> Result[bool, Exception]:
+    @_as_result
+    async def unlink_trigger_from_event_type(self, event_type_id: str, trigger_id: str, headers: Optional[Dict[str, str]] = None) -> Result[bool, Exception]:
         """Remove the EventType⇄Trigger relation.
 
         Args:
@@ -460,17 +644,12 @@ class ShieldXClient:
         Returns:
             Result with `True` if the unlink succeeded.
         """
-        try:
-            await self._delete(f"/event-types/{event_type_id}/triggers/{trigger_id}", operation="UNLINK_TRIGGER_FROM_EVENT_TYPE", headers=headers)
-            return Ok(True)
-        except Exception as e:
-            return Err(e)
-        
-        # --- Relaciones Trigger ⇄ Rule ---
-
+        result = await self._delete(f"/event-types/{event_type_id}/triggers/{trigger_id}", operation="UNLINK_TRIGGER_FROM_EVENT_TYPE", headers=headers)
+        return result.map(lambda _: True)
 
 # --- Relaciones Trigger ⇄ Rule ---
 
+    @_as_result
     async def is_rule_bound_to_trigger_bool(self, trigger_id: str, rule_id: str) -> Result[bool, Exception]:
         """Check whether a Rule is bound to a Trigger.
 
@@ -481,14 +660,12 @@ class ShieldXClient:
         Returns:
             True if the relation exists; otherwise False.
         """
-        try:
-            res = await self.list_rules_for_trigger(trigger_id)
-            if res.is_err:
-                return Err(res.unwrap_err())
-            return Ok(any(link.rule_id == rule_id for link in res.unwrap()))
-        except Exception as e:
-            return Err(e)
+        res = await self.list_rules_for_trigger(trigger_id)
+        if res.is_err:
+            return Err(res.unwrap_err())
+        return Ok(any(link.rule_id == rule_id for link in res.unwrap()))
 
+    @_as_result
     async def bind_rule_to_trigger_dict(self, trigger_id: str, rule_id: str) -> dict:
         """Bind a Rule to a Trigger.
 
@@ -499,16 +676,14 @@ class ShieldXClient:
         Returns:
             Dict `{"trigger_id": str, "rule_id": str}`.
         """
-        try:
-            res = await self.link_rule_to_trigger(trigger_id, rule_id)
-            if res.is_err:
-                return Err(res.unwrap_err())
-            return Ok({"trigger_id": trigger_id, "rule_id": rule_id})
-        except Exception as e:
-            return Err(e)
+        res = await self.link_rule_to_trigger(trigger_id, rule_id)
+        if res.is_err:
+            return Err(res.unwrap_err())
+        return Ok({"trigger_id": trigger_id, "rule_id": rule_id})
 
 
-    async def link_rule_to_trigger(self, trigger_id: str, rule_id: str, headers: Dict[str, str] = {}) -> Result[bool, Exception]:
+    @_as_result
+    async def link_rule_to_trigger(self, trigger_id: str, rule_id: str, headers: Optional[Dict[str, str]] = None) -> Result[bool, Exception]:
         """Create the Trigger⇄Rule relation.
 
         Args:
@@ -519,13 +694,30 @@ class ShieldXClient:
         Returns:
             Result with `True` if the link was created.
         """
-        try:
-            await self._post(f"/triggers/{trigger_id}/rules/{rule_id}", payload={}, model=None,operation="LINK_RULE_TO_TRIGGER", headers=headers)
-            return Ok(True)
-        except Exception as e:
-            return Err(e)
+        result = await self._post(f"/triggers/{trigger_id}/rules/{rule_id}", payload={}, model=None,operation="LINK_RULE_TO_TRIGGER", headers=headers)
+        return result.map(lambda _: True)
+
+    @_as_result
+    async def link_rules_to_trigger(self, trigger_id: str, rule_ids: List[str], batch_size: int = 16, headers: Optional[Dict[str, str]] = None) -> Result[bool, Exception]:
+        """Create the Trigger⇄Rule relation for several Rules.
+
+        Links are sent concurrently in batches of `batch_size` requests.
 
-    async def list_rules_for_trigger(self, trigger_id: str, headers: Dict[str, str] = {})-> Result[List[DTOS.RulesTriggerDTO], Exception]:
+        Args:
+            trigger_id: Trigger ID.
+            rule_ids: Rule IDs to link.
+            batch_size: Maximum number of link requests in flight at once.
+            headers: Optional extra headers.
+
+        Returns:
+            Result with `True` if every link was created, otherwise the first error.
+        """
+        return await self._link_in_batches(
+            lambda rule_id: self.link_rule_to_trigger(trigger_id, rule_id, headers=headers),
+            rule_ids, batch_size)
+
+    @_as_result
+    async def list_rules_for_trigger(self, trigger_id: str, headers: Optional[Dict[str, str]] = None)-> Result[List[DTOS.RulesTriggerDTO], Exception]:
         """List Rules bound to a Trigger.
 
         Args:
@@ -535,12 +727,10 @@ class ShieldXClient:
         Returns:
             Result with a list of `RulesTriggerDTO`.
         """
-        try:
-            return await self._get(f"/triggers/{trigger_id}/rules",model=DTOS.RulesTriggerDTO,operation="LIST_RULES_FOR_TRIGGER", headers=headers,is_list=True)
-        except Exception as e:
-            return Err(e)    
+        return await self._get_list(f"/triggers/{trigger_id}/rules",model=DTOS.RulesTriggerDTO,operation="LIST_RULES_FOR_TRIGGER", headers=headers)
 
-    async def create_and_link_rule(self, trigger_id: str, rule_payload: DTOS.RuleCreateDTO, headers: Dict[str, str] = {}) -> Result[DTOS.MessageWithIDDTO, Exception]:
+    @_as_result
+    async def create_and_link_rule(self, trigger_id: str, rule_payload: DTOS.RuleCreateDTO, headers: Optional[Dict[str, str]] = None) -> Result[DTOS.MessageWithIDDTO, Exception]:
         """Create a Rule and link it to a Trigger.
 
         Args:
@@ -551,14 +741,12 @@ class ShieldXClient:
         Returns:
             Result with `MessageWithIDDTO` for the created Rule.
         """
-        try:
-            payload = json.loads(rule_payload.model_dump_json(by_alias=True))
-            result = await self._post(f"/triggers/{trigger_id}/rules", payload, model=DTOS.MessageWithIDDTO,operation="CREATE_RULE_AND_LINK_RULE", headers=headers) 
-            return result
-        except Exception as e:
-            return Err(e)
+        payload = rule_payload.model_dump_json(by_alias=True).encode()
+        result = await self._post(f"/triggers/{trigger_id}/rules", payload, model=DTOS.MessageWithIDDTO,operation="CREATE_RULE_AND_LINK_RULE", headers=headers) 
+        return result
 
-    async def unlink_rule_from_trigger(self, trigger_id: str, rule_id: str, headers: Dict[str, str] = {}) -> Result[bool, Exception]:
+    @_as_result
+    async def unlink_rule_from_trigger(self, trigger_id: str, rule_id: str, headers: Optional[Dict[str, str]] = None) -> Result[bool, Exception]:
         """Remove the Trigger⇄Rule relation.
 
         Args:
@@ -569,14 +757,12 @@ class ShieldXClient:
         Returns:
             Result with `True` if the unlink succeeded.
         """
-        try:
-            await self._delete(f"/triggers/{trigger_id}/rules/{rule_id}",operation="UNLINK_RULE_FROM_TRIGGER",  headers=headers)
-            return Ok(True)
-        except Exception as e:
-            return Err(e)
+        result = await self._delete(f"/triggers/{trigger_id}/rules/{rule_id}",operation="UNLINK_RULE_FROM_TRIGGER",  headers=headers)
+        return result.map(lambda _: True)
 
 # --- CRUD Rule (helpers estilo dict) ---
 
+    @_as_result
     async def find_rule_by_target_dict(self, target: str) -> Result[Optional[dict], Exception]:
         """Find a Rule by `target`.
 
@@ -586,17 +772,15 @@ class ShieldXClient:
         Returns:
             Dict `{"id": str, "target": str}` if found, otherwise `None`.
         """
-        try:
-            res = await self.list_rules()
-            if res.is_err:
-                return Err(res.unwrap_err())
-            for dto in res.unwrap():
-                if dto.target == target:
-                    return Ok({"id": dto.rule_id, "target": dto.target})
-            return Ok(None)
-        except Exception as e:
-            return Err(e)
-
+        res = await self.list_rules()
+        if res.is_err:
+            return Err(res.unwrap_err())
+        for dto in res.unwrap():
+            if dto.target == target:
+                return Ok({"id": dto.rule_id, "target": dto.target})
+        return Ok(None)
+
+    @_as_result
     async def create_rule_dict(self, target: str, parameters: dict) -> Result[dict, Exception]:
         """Create a Rule and return a small dict.
 
@@ -607,17 +791,15 @@ class ShieldXClient:
         Returns:
             Dict `{"id": str, "target": str}`.
         """
-        try:
-            res = await self.create_rule(DTOS.RuleCreateDTO(target=target, parameters=parameters))
-            if res.is_err:
-                return Err(res.unwrap_err())
-            msg = res.unwrap()
-            return Ok({"id": msg.id, "target": target})
-        except Exception as e:
-            return Err(e)
+        res = await self.create_rule(DTOS.RuleCreateDTO(target=target, parameters=parameters))
+        if res.is_err:
+            return Err(res.unwrap_err())
+        msg = res.unwrap()
+        return Ok({"id": msg.id, "target": target})
 
 
-    async def create_rule(self, rule: DTOS.RuleCreateDTO, headers: Dict[str, str] = {}) -> Result[DTOS.MessageWithIDDTO, Exception]:
+    @_as_result
+    async def create_rule(self, rule: DTOS.RuleCreateDTO, headers: Optional[Dict[str, str]] = None) -> Result[DTOS.MessageWithIDDTO, Exception]:
         """Create a new Rule.
 
         Args:
@@ -627,14 +809,12 @@ class ShieldXClient:
         Returns:
             Result with `MessageWithIDDTO` (created id).
         """
-        try:
-            payload = json.loads(rule.model_dump_json(by_alias=True))
-            response = await self._post("/rules", payload, model=DTOS.MessageWithIDDTO,operation="CREATE_RULE", headers=headers)
-            return response
-        except Exception as e:
-            return Err(e)
+        payload = rule.model_dump_json(by_alias=True).encode()
+        response = await self._post("/rules", payload, model=DTOS.MessageWithIDDTO,operation="CREATE_RULE", headers=headers)
+        return response
 
-    async def get_rule_by_id(self, rule_id: str, headers: Dict[str, str] = {})  -> Result[DTOS.RuleResponseDTO, Exception]:
+    @_as_result
+    async def get_rule_by_id(self, rule_id: str, headers: Optional[Dict[str, str]] = None)  -> Result[DTOS.RuleResponseDTO, Exception]:
         """Get a Rule by ID.
 
         Args:
@@ -644,13 +824,12 @@ class ShieldXClient:
         Returns:
             Result with `RuleResponseDTO`.
         """
-        try:
-            response = await self._get(f"/rules/{rule_id}", model=DTOS.RuleResponseDTO,operation="GET_RULE_BY_ID", headers=headers)
-            return response
-        except Exception as e:
-            return Err(e)    
+        self._require_id("rule_id", rule_id)
+        response = await self._get(f"/rules/{rule_id}", model=DTOS.RuleResponseDTO,operation="GET_RULE_BY_ID", headers=headers)
+        return response
 
-    async def update_rule(self, rule_id: str, rule: DTOS.RuleCreateDTO, headers: Dict[str, str] = {}) -> Result[DTOS.MessageWithIDDTO, Exception]:
+    @_as_result
+    async def update_rule(self, rule_id: str, rule: DTOS.RuleCreateDTO, headers: Optional[Dict[str, str]] = None) -> Result[DTOS.MessageWithIDDTO, Exception]:
         """Update a Rule.
 
         Args:
@@ -661,14 +840,12 @@ class ShieldXClient:
         Returns:
             Result with `MessageWithIDDTO` (backend message).
         """
-        try:
-            payload = json.loads(rule.model_dump_json(by_alias=True))
-            response = await self._put(f"/rules/{rule_id}", payload, model=DTOS.MessageWithIDDTO, operation="UPDATE_RULE", headers=headers)
-            return response
-        except Exception as e:
-            return Err(e)
+        payload = rule.model_dump_json(by_alias=True).encode()
+        response = await self._put(f"/rules/{rule_id}", payload, model=DTOS.MessageWithIDDTO, operation="UPDATE_RULE", headers=headers)
+        return response
 
-    async def list_rules(self, headers: Dict[str, str] = {}) -> Result[List[DTOS.RuleResponseDTO],Exception]:
+    @_as_result
+    async def list_rules(self, headers: Optional[Dict[str, str]] = None) -> Result[List[DTOS.RuleResponseDTO],Exception]:
         """List all Rules.
 
         Args:
@@ -677,13 +854,27 @@ class ShieldXClient:
         Returns:
             Result with a list of `RuleResponseDTO`.
         """
-        try:
-            rules = await self._get("/rules", model=DTOS.RuleResponseDTO, operation="LIST_RULES", headers=headers,is_list=True)
-            return rules
-        except Exception as e:
-            return Err(e)
+        rules = await self._get_list("/rules", model=DTOS.RuleResponseDTO, operation="LIST_RULES", headers=headers)
+        return rules
+
+    @_as_result
+    async def count_rules(self, headers: Optional[Dict[str, str]] = None) -> Result[int, Exception]:
+        """Count Rules without validating them.
+
+        Sends the same request as `list_rules` (and shares its cache entry) but
+        only returns the length of the decoded array.
+
+        Args:
+            headers: Optional extra headers.
 
-    async def delete_rule(self, rule_id: str, headers: Dict[str, str] = {}) -> Result[bool, Exception]:
+        Returns:
+            Result with the number of Rules (`TypeError` if the body is not a list).
+        """
+        rules = await self._get_json("/rules", operation="COUNT_RULES", headers=headers)
+        return Ok(self._array_len(rules))
+
+    @_as_result
+    async def delete_rule(self, rule_id: str, headers: Optional[Dict[str, str]] = None) -> Result[bool, Exception]:
         """Delete a Rule by ID.
 
         Args:
@@ -693,14 +884,12 @@ class ShieldXClient:
         Returns:
             Result with `True` if the deletion succeeded.
         """
-        try:
-            await self._delete(f"/rules/{rule_id}", operation="DELETE_RULE", headers=headers)
-            return Ok(True)
-        except Exception as e:
-            return Err(e)
+        result = await self._delete(f"/rules/{rule_id}", operation="DELETE_RULE", headers=headers)
+        return result.map(lambda _: True)
 
     # --- CRUD: Trigger (por nombre) ---
         
+    @_as_result
     async def find_trigger_by_name_dict(self, name: str) -> Result[Optional[dict], Exception]:
         """Find a Trigger by name.
 
@@ -710,19 +899,17 @@ class ShieldXClient:
         Returns:
             Dict `{"id": str, "name": str}` if found; `None` on 404.
         """
-        try:
-            res = await self.get_trigger_by_name(name)
-            if res.is_ok:
-                dto = res.unwrap()
-                return Ok({"id": dto.trigger_id, "name": dto.name})
-            # Si fue 404, tu _get ya convertiría en Err; aquí lo tratamos como None si es 404.
-            err = res.unwrap_err()
-            if isinstance(err, httpx.HTTPStatusError) and err.response.status_code == 404:
-                return Ok(None)
-            return Err(err)
-        except Exception as e:
-            return Err(e)
+        res = await self.get_trigger_by_name(name)
+        if res.is_ok:
+            dto = res.unwrap()
+            return Ok({"id": dto.trigger_id, "name": dto.name})
+        # Si fue 404, tu _get ya convertiría en Err; aquí lo tratamos como None si es 404.
+        err = res.unwrap_err()
+        if isinstance(err, httpx.HTTPStatusError) and err.response.status_code == 404:
+            return Ok(None)
+        return Err(err)
 
+    @_as_result
     async def create_trigger_dict(self, name: str) -> Result[dict, Exception]:
         """Create a Trigger and return a small dict.
 
@@ -732,16 +919,14 @@ class ShieldXClient:
         Returns:
             Dict `{"id": str, "name": str}`.
         """
-        try:
-            res = await self.create_trigger(DTOS.TriggerCreateDTO(name=name))
-            if res.is_err:
-                return Err(res.unwrap_err())
-            msg = res.unwrap()
-            return Ok({"id": msg.id, "name": name})
-        except Exception as e:
-            return Err(e)
-
-    async def create_trigger(self,  trigger: DTOS.TriggerCreateDTO, headers: Dict[str, str] = {}) -> Result[DTOS.MessageWithIDDTO, Exception]:
+        res = await self.create_trigger(DTOS.TriggerCreateDTO(name=name))
+        if res.is_err:
+            return Err(res.unwrap_err())
+        msg = res.unwrap()
+        return Ok({"id": msg.id, "name": name})
+
+    @_as_result
+    async def create_trigger(self,  trigger: DTOS.TriggerCreateDTO, headers: Optional[Dict[str, str]] = None) -> Result[DTOS.MessageWithIDDTO, Exception]:
         """Create a new Trigger.
 
         Args:
@@ -751,14 +936,12 @@ class ShieldXClient:
         Returns:
             Result with `MessageWithIDDTO` (created id).
         """
-        try:
-            payload = trigger.model_dump(by_alias=True)
-            response = await self._post("/triggers/", payload, model=DTOS.MessageWithIDDTO, operation="CREATE_TRIGGER", headers=headers)
-            return response
-        except Exception as e:
-            return Err(e)
+        payload = trigger.model_dump_json(by_alias=True).encode()
+        response = await self._post("/triggers/", payload, model=DTOS.MessageWithIDDTO, operation="CREATE_TRIGGER", headers=headers)
+        return response
 
-    async def get_trigger_by_name(self, name: str, headers: Dict[str, str] = {}) -> Result[DTOS.TriggerResponseDTO, Exception]:
+    @_as_result
+    async def get_trigger_by_name(self, name: str, headers: Optional[Dict[str, str]] = None) -> Result[DTOS.TriggerResponseDTO, Exception]:
         """Get a Trigger by name.
 
         Args:
@@ -768,13 +951,12 @@ class ShieldXClient:
         Returns:
             Result with `TriggerResponseDTO`.
         """
-        try:
-            response = await self._get(f"/triggers/{name}", model=DTOS.TriggerResponseDTO, operation="GET_TRIGGER_BY_NAME", headers=headers)
-            return response
-        except Exception as e:
-            return Err(e)
+        self._require_id("name", name)
+        response = await self._get(f"/triggers/{name}", model=DTOS.TriggerResponseDTO, operation="GET_TRIGGER_BY_NAME", headers=headers)
+        return response
 
-    async def get_all_triggers(self, headers: Dict[str, str] = {}) -> Result[List[DTOS.TriggerResponseDTO], Exception]:
+    @_as_result
+    async def get_all_triggers(self, headers: Optional[Dict[str, str]] = None) -> Result[List[DTOS.TriggerResponseDTO], Exception]:
         """List all Triggers.
 
         Args:
@@ -783,13 +965,11 @@ class ShieldXClient:
         Returns:
             Result with a list of `TriggerResponseDTO`.
         """
-        try:
-            response = await self._get("/triggers/", model=DTOS.TriggerResponseDTO, operation="LIST_TRIGGERS", headers=headers, is_list=True)
-            return response
-        except Exception as e:
-            return Err(e)
+        response = await self._get_list("/triggers/", model=DTOS.TriggerResponseDTO, operation="LIST_TRIGGERS", headers=headers)
+        return response
 
-    async def update_trigger(self, name: str, updated_trigger: DTOS.TriggerCreateDTO, headers: Dict[str, str] = {}) -> Result[DTOS.MessageWithIDDTO, Exception]:
+    @_as_result
+    async def update_trigger(self, name: str, updated_trigger: DTOS.TriggerCreateDTO, headers: Optional[Dict[str, str]] = None) -> Result[DTOS.MessageWithIDDTO, Exception]:
         """Update a Trigger by name.
 
         Args:
@@ -800,14 +980,12 @@ class ShieldXClient:
         Returns:
             Result with `MessageWithIDDTO`.
         """
-        try:
-            payload = updated_trigger.model_dump(by_alias=True)
-            response = await self._put(f"/triggers/{name}", payload, model=DTOS.MessageWithIDDTO, operation="UPDATE_TRIGGER", headers=headers)
-            return response
-        except Exception as e:
-            return Err(e)
+        payload = updated_trigger.model_dump_json(by_alias=True).encode()
+        response = await self._put(f"/triggers/{name}", payload, model=DTOS.MessageWithIDDTO, operation="UPDATE_TRIGGER", headers=headers)
+        return response
 
-    async def delete_trigger(self, name: str, headers: Dict[str, str] = {}) -> Result[bool, Exception]:
+    @_as_result
+    async def delete_trigger(self, name: str, headers: Optional[Dict[str, str]] = None) -> Result[bool, Exception]:
         """Delete a Trigger by name.
 
         Args:
@@ -817,14 +995,12 @@ class ShieldXClient:
         Returns:
             Result with `True` if the deletion succeeded.
         """
-        try:
-            await self._delete(f"/triggers/{name}", operation="DELETE_TRIGGER", headers=headers)
-            return Ok(True)
-        except Exception as e:
-            return Err(e)
+        result = await self._delete(f"/triggers/{name}", operation="DELETE_TRIGGER", headers=headers)
+        return result.map(lambda _: True)
 
     # --- Relaciones Trigger ⇄ Trigger (Encadenamiento) ---
 
+    @_as_result
     async def is_trigger_linked_to_trigger_bool(self, parent_id: str, child_id: str) -> Result[bool, Exception]:
         """Check whether a parent Trigger is linked to a child Trigger.
 
@@ -835,14 +1011,13 @@ class ShieldXClient:
         Returns:
             True if the relation exists; otherwise False.
         """
-        try:
-            res = await self.list_trigger_children(parent_id)
-            if res.is_err:
-                return Err(res.unwrap_err())
-            return Ok(any(link.trigger_child_id == child_id for link in res.unwrap()))
-        except Exception as e:
-            return Err(e)
+        res = await self.list_trigger_children(parent_id)
+        if res.is_err:
+            return Err(res.unwrap_err())
+        child_ids = {link.trigger_child_id for link in res.unwrap()}
+        return Ok(child_id in child_ids)
 
+    @_as_result
     async def bind_trigger_to_trigger_dict(self, parent_id: str, child_id: str) -> Result[dict, Exception]:
         """Bind a child Trigger to a parent Trigger.
 
@@ -853,16 +1028,14 @@ class ShieldXClient:
         Returns:
             Dict `{"trigger_parent_id": str, "trigger_child_id": str}`.
         """
-        try:
-            res = await self.link_trigger_child(parent_id, child_id)
-            if res.is_err:
-                return Err(res.unwrap_err())
-            return Ok({"trigger_parent_id": parent_id, "trigger_child_id": child_id})
-        except Exception as e:
-            return Err(e)
+        res = await self.link_trigger_child(parent_id, child_id)
+        if res.is_err:
+            return Err(res.unwrap_err())
+        return Ok({"trigger_parent_id": parent_id, "trigger_child_id": child_id})
 
 
-    async def link_trigger_child(self, parent_id: str, child_id: str, headers: Dict[str, str] = {}) -> Result[bool, Exception]:
+    @_as_result
+    async def link_trigger_child(self, parent_id: str, child_id: str, headers: Optional[Dict[str, str]] = None) -> Result[bool, Exception]:
         """Create the Parent⇄Child Trigger relation.
 
         Args:
@@ -873,14 +1046,30 @@ class ShieldXClient:
         Returns:
             Result with `True` if the link was created.
         """
-        try:
-            
-            await self._post(f"/triggers/{parent_id}/children/{child_id}", payload={}, model=None, operation="LINK_TRIGGER_CHILD", headers=headers)
-            return Ok(True)
-        except Exception as e:
-            return Err(e)
+        result = await self._post(f"/triggers/{parent_id}/children/{child_id}", payload={}, model=None, operation="LINK_TRIGGER_CHILD", headers=headers)
+        return result.map(lambda _: True)
+
+    @_as_result
+    async def link_trigger_children(self, parent_id: str, child_ids: List[str], batch_size: int = 16, headers: Optional[Dict[str, str]] = None) -> Result[bool, Exception]:
+        """Create the Parent⇄Child Trigger relation for several children.
+
+        Links are sent concurrently in batches of `batch_size` requests.
+
+        Args:
+            parent_id: Parent Trigger ID.
+            child_ids: Child Trigger IDs to link.
+            batch_size: Maximum number of link requests in flight at once.
+            headers: Optional extra headers.
 
-    async def list_trigger_children(self, parent_id: str, headers: Dict[str, str] = {}) -> Result[List[DTOS.TriggersTriggersDTO], Exception]:
+        Returns:
+            Result with `True` if every link was created, otherwise the first error.
+        """
+        return await self._link_in_batches(
+            lambda child_id: self.link_trigger_child(parent_id, child_id, headers=headers),
+            child_ids, batch_size)
+
+    @_as_result
+    async def list_trigger_children(self, parent_id: str, headers: Optional[Dict[str, str]] = None) -> Result[List[DTOS.TriggersTriggersDTO], Exception]:
         """List all children for a parent Trigger.
 
         Args:
@@ -890,14 +1079,12 @@ class ShieldXClient:
         Returns:
             Result with a list of `TriggersTriggersDTO`.
         """
-        try:
-            response = await self._get(
-                f"/triggers/{parent_id}/children",model=DTOS.TriggersTriggersDTO, operation="LIST_TRIGGER_CHILDREN", headers=headers,is_list=True)
-            return response
-        except Exception as e:
-            return Err(e)
+        response = await self._get_list(
+            f"/triggers/{parent_id}/children",model=DTOS.TriggersTriggersDTO, operation="LIST_TRIGGER_CHILDREN", headers=headers)
+        return response
 
-    async def list_trigger_parents(self, child_id: str, headers: Dict[str, str] = {}) -> Result[List[DTOS.TriggersTriggersDTO], Exception]:
+    @_as_result
+    async def list_trigger_parents(self, child_id: str, headers: Optional[Dict[str, str]] = None) -> Result[List[DTOS.TriggersTriggersDTO], Exception]:
         """List all parents for a child Trigger.
 
         Args:
@@ -907,13 +1094,11 @@ class ShieldXClient:
         Returns:
             Result with a list of `TriggersTriggersDTO`.
         """
-        try:
-            response = await self._get(f"/triggers/{child_id}/parents", model=DTOS.TriggersTriggersDTO, operation="LIST_TRIGGER_PARENTS", headers=headers,is_list=True)
-            return response
-        except Exception as e:
-            return Err(e)
+        response = await self._get_list(f"/triggers/{child_id}/parents", model=DTOS.TriggersTriggersDTO, operation="LIST_TRIGGER_PARENTS", headers=headers)
+        return response
 
-    async def unlink_trigger_child(self, parent_id: str, child_id: str, headers: Dict[str, str] = {}) -> Result[bool, Exception]:
+    @_as_result
+    async def unlink_trigger_child(self, parent_id: str, child_id: str, headers: Optional[Dict[str, str]] = None) -> Result[bool, Exception]:
         """Remove the Parent⇄Child Trigger relation.
 
         Args:
@@ -924,125 +1109,247 @@ class ShieldXClient:
         Returns:
             Result with `True` if the unlink succeeded.
         """
-        try:
-            await self._delete(f"/triggers/{parent_id}/children/{child_id}", operation="UNLINK_TRIGGER_CHILD", headers=headers)
-            return Ok(True)
-        except Exception as e:
-            return Err(e)
+        result = await self._delete(f"/triggers/{parent_id}/children/{child_id}", operation="UNLINK_TRIGGER_CHILD", headers=headers)
+        return result.map(lambda _: True)
+
+
+    async def _link_in_batches(self, link: Callable[[str], Awaitable[Result[bool, Exception]]], ids: List[str], batch_size: int) -> Result[bool, Exception]:
+        """Run `link(id)` for every id, `batch_size` requests at a time.
+
+        Args:
+            link: Single-item link coroutine function.
+            ids: IDs to link.
+            batch_size: Number of concurrent requests per batch.
+
+        Returns:
+            Result with `True`, or the first error found in a batch.
+        """
+        if batch_size < 1:
+            return Err(ValueError(f"batch_size must be >= 1, got {batch_size}"))
+        for start in range(0, len(ids), batch_size):
+            results = await asyncio.gather(*(link(i) for i in ids[start:start + batch_size]))
+            for res in results:
+                if res.is_err:
+                    return Err(res.unwrap_err())
+        return Ok(True)
+
+    @classmethod
+    def _list_adapter(cls, model: Type[R]) -> TypeAdapter:
+        """Return the cached `TypeAdapter(List[model])`.
+
+        Validating the whole list through one adapter runs in a single pydantic-core
+        call instead of one `model_validate` per item, and the adapter's schema is
+        only built once per model.
+        """
+        adapter = cls._list_adapters.get(model)
+        if adapter is None:
+            adapter = cls._list_adapters.setdefault(model, TypeAdapter(List[model]))
+        return adapter
+
+    @staticmethod
+    def _require_id(name: str, value: str) -> None:
+        """Reject an empty or blank identifier before any request is sent.
+
+        Raises:
+            ValueError: If `value` is empty or only whitespace.
+        """
+        if not value or not value.strip():
+            raise ValueError(f"{name} must be a non-empty string")
+
+    @staticmethod
+    def _array_len(body: Any) -> int:
+        """Length of a decoded list response.
+
+        Raises:
+            TypeError: If the body is not a JSON array.
+        """
+        if not isinstance(body, list):
+            raise TypeError(f"expected a JSON array, got {type(body).__name__}")
+        return len(body)
+
+    @staticmethod
+    def _encode(payload: Any) -> bytes:
+        """Encode a request body; pre-serialized `bytes` (e.g. `model_dump_json().encode()`) pass through."""
+        return payload if isinstance(payload, bytes) else orjson.dumps(payload)
 
+    @staticmethod
+    def _decode(response: httpx.Response) -> Any:
+        """Decode a response body: MessagePack if the server sent it, JSON (orjson) otherwise."""
+        if ormsgpack is not None and response.headers.get("Content-Type", "").startswith(MSGPACK_MEDIA_TYPE):
+            return ormsgpack.unpackb(response.content)
+        return orjson.loads(response.content)
+
+    async def _send(self, method: str, path: str, operation: str, *, content: Optional[bytes] = None, headers: Optional[Dict[str, str]] = None, params: Optional[Dict[str, str]] = None) -> httpx.Response:
+        """Send a request through the pooled client and log status and latency.
+
+        At most `max_concurrency` requests are in flight at once. The log record is
+        only built when INFO is enabled for the client logger. Any non-GET request
+        clears the response cache.
+
+        Args:
+            method: HTTP method.
+            path: Relative path.
+            operation: Operation name used in the log event.
+            content: Encoded request body.
+            headers: Optional extra headers.
+            params: Optional query parameters (percent-encoded by httpx).
+
+        Returns:
+            The raw `httpx.Response` (status not checked).
+        """
+        client = self._http()
+        t1 = T.perf_counter()
+        async with self._sem:
+            response = await client.request(method, path, content=content, headers=headers, params=params)
+        if method != "GET" and self._cache is not None:
+            self._cache.clear()
+        if L.isEnabledFor(logging.INFO):
+            L.info({"event": f"CLIENT.{operation}.RESPONSE",
+                    "path": path,
+                    "status": response.status_code,
+                    "time": T.perf_counter() - t1
+                    })
+        return response
 
-    async def _post(self, path: str, payload: Dict[str, Any],model:Type[R], operation: str, headers: Dict[str, str] = {})->Result[R, Exception]:
+    @_as_result
+    async def _post(self, path: str, payload: Any,model:Type[R], operation: str, headers: Optional[Dict[str, str]] = None)->Result[R, Exception]:
         """POST helper that validates the JSON response with a Pydantic model.
 
         Args:
             path: Relative path (joined with `base_url`).
-            payload: Request JSON body.
-            model: Pydantic model used to parse the response.
+            payload: Request JSON body, or already encoded JSON `bytes`.
+            model: Pydantic model used to parse the response (when None, returns raw JSON).
             headers: Optional extra headers.
 
         Returns:
-            Result with an instance of `model`.
+            Result with an instance of `model` (or raw JSON if `model` is None;
+            `None` for an empty body).
         """
-        try:
-            url = f"{self.base_url}{path}"
-            full_headers = {**self.headers, **headers}
-            t1 = T.time()
+        response = await self._send("POST", path, operation, content=self._encode(payload), headers=headers)
+        response.raise_for_status()
+        if model is None:
+            return Ok(self._decode(response) if response.content else None)
+        return Ok(model.model_validate(self._decode(response)))
 
-            
+    async def _get_json(self, path: str, operation: str, headers: Optional[Dict[str, str]] = None, params: Optional[Dict[str, str]] = None) -> Any:
+        """GET `path` and return the decoded JSON body.
 
-            async with httpx.AsyncClient(headers=full_headers) as client:
-                response = await client.post(url, json=payload)
+        When the response cache is enabled, fresh entries are served without a
+        request and stale ones are revalidated with `If-None-Match`/`If-Modified-Since`.
 
-            
-            
-            L.info({"event": f"CLIENT.{operation}.RESPONSE", 
-                    "path": path, 
-                    "status": response.status_code, 
-                    "time": T.time() - t1
-                    })
+        Args:
+            path: Relative path.
+            operation: Operation name used in the log event.
+            headers: Optional extra headers.
+            params: Optional query parameters.
 
-            response.raise_for_status()
-            # if response.status_code == 204 or not response.content:
-                # return Ok({})
-            return Ok(model.model_validate(response.json()))
-        except Exception as e:
-            return Err(e)
+        Raises:
+            httpx.HTTPStatusError: On a non-2xx response.
+        """
+        cache_key = entry = generation = None
+        if self._cache is not None:
+            # un POST/PUT/DELETE concurrente invalida lo que devuelva este GET
+            generation = self._cache.generation
+            cache_key = self._cache.key(path, headers or {}, params)
+            entry = self._cache.get(cache_key)
+            if entry is not None:
+                if entry.is_fresh():
+                    return entry.body
+                headers = {**(headers or {}), **entry.validators()}
+
+        response = await self._send("GET", path, operation, headers=headers, params=params)
+        if entry is not None and response.status_code == 304:
+            return self._cache.revalidated(cache_key, entry, response, generation).body
+        response.raise_for_status()
+        raw = self._decode(response)
+        if cache_key is not None:
+            self._cache.store(cache_key, response, raw, generation)
+        return raw
+
+    async def _get_parsed(self, path: str, operation: str, headers: Optional[Dict[str, str]], params: Optional[Dict[str, str]], parse: Callable[[Any], Any], parse_key: Hashable) -> Any:
+        """GET `path` and return `parse(body)`, memoized on the cached response.
+
+        With the response cache enabled, the parsed value is kept on the cache entry
+        under `parse_key`, so fresh or `304`-revalidated hits skip pydantic validation
+        as well as the request. Memoized models are shared between callers and must
+        be treated as read-only.
 
-    async def _get(self, path: str,model:Type[R], operation: str, headers: Dict[str, str] = {},is_list:bool =False)->Result[R| List[R], Exception]:
+        Args:
+            path: Relative path.
+            operation: Operation name used in the log event.
+            headers: Optional extra headers.
+            params: Optional query parameters.
+            parse: Function turning the decoded body into the result.
+            parse_key: Identifies `parse` among the values memoized for `path`.
+        """
+        if self._cache is None:
+            return parse(await self._get_json(path, operation, headers, params))
+        cache_key = self._cache.key(path, headers or {}, params)
+        entry = self._cache.get(cache_key)
+        if entry is not None and entry.is_fresh() and parse_key in entry.parsed:
+            return entry.parsed[parse_key]
+        raw = await self._get_json(path, operation, headers, params)
+        entry = self._cache.get(cache_key)
+        if entry is not None and entry.body is raw:
+            if parse_key not in entry.parsed:
+                entry.parsed[parse_key] = parse(raw)
+            return entry.parsed[parse_key]
+        return parse(raw)
+
+    @_as_result
+    async def _get(self, path: str, model: Type[R], operation: str, headers: Optional[Dict[str, str]] = None, params: Optional[Dict[str, str]] = None) -> Result[R, Exception]:
         """GET helper that validates the JSON response with a Pydantic model.
 
         Args:
             path: Relative path.
             model: Expected Pydantic model.
             headers: Optional extra headers.
-            is_list: When True, parse the response as a list of `model`.
+            params: Optional query parameters.
 
         Returns:
-            Result with `model` or `List[model]`.
+            Result with an instance of `model`.
         """
-        try:
-            url = f"{self.base_url}{path}"
-            full_headers = {**self.headers, **headers}
-            t1 = T.time()
-
-            async with httpx.AsyncClient(headers=full_headers) as client:
-                response = await client.get(url)
-
-            
-            L.info({"event": f"CLIENT.{operation}.RESPONSE", 
-                    "path": path, 
-                    "status": response.status_code, 
-                    "time": T.time() - t1
-                    })
+        return Ok(await self._get_parsed(path, operation, headers, params, model.model_validate, model))
 
-            response.raise_for_status()
-            raw = response.json()
-            if is_list:
-                parsed = [model.model_validate(item) for item in raw]
-                return Ok(parsed)
-            return Ok(model.model_validate(raw))
-        except Exception as e:
-            return Err(e)
-
-    async def _put(self, path: str, payload: Any, model: Type[R], operation: str, headers: Dict[str, str] = {}) -> Result[R , Exception]:
-        """PUT helper with Pydantic validation.
+    @_as_result
+    async def _get_list(self, path: str, model: Type[R], operation: str, headers: Optional[Dict[str, str]] = None, params: Optional[Dict[str, str]] = None) -> Result[List[R], Exception]:
+        """GET helper that validates a JSON array with the cached list adapter of `model`.
 
         Args:
             path: Relative path.
-            payload: Request JSON body.
-            model: Expected Pydantic model (when None, returns raw JSON).
+            model: Pydantic model of each item.
             headers: Optional extra headers.
+            params: Optional query parameters.
 
         Returns:
-            Result with an instance of `model` (or raw JSON if `model` is None).
+            Result with `List[model]`.
         """
-        try:
-            url = f"{self.base_url}{path}"
-            full_headers = {**self.headers, **headers}
-            t1 = T.time()
+        return Ok(await self._get_parsed(path, operation, headers, params, self._list_adapter(model).validate_python, (list, model)))
 
-            async with httpx.AsyncClient(headers=full_headers) as client:
-                response = await client.put(url, json=payload)
-
-            L.info({
-                "event": f"CLIENT.{operation}.RESPONSE",
-                "path": path,
-                "status": response.status_code,
-                "time": T.time() - t1
-            })
+    @_as_result
+    async def _put(self, path: str, payload: Any, model: Type[R], operation: str, headers: Optional[Dict[str, str]] = None) -> Result[R , Exception]:
+        """PUT helper with Pydantic validation.
 
-            response.raise_for_status()
+        Args:
+            path: Relative path.
+            payload: Request JSON body, or already encoded JSON `bytes`.
+            model: Expected Pydantic model (when None, returns raw JSON).
+            headers: Optional extra headers.
 
-            #if response.status_code == 204 or not response.content:
-                #return Ok(True)
+        Returns:
+            Result with an instance of `model` (or raw JSON if `model` is None;
+            `None` for an empty body).
+        """
+        response = await self._send("PUT", path, operation, content=self._encode(payload), headers=headers)
+        response.raise_for_status()
 
-            json_data = response.json()
-            return Ok(model.model_validate(json_data) if model else json_data)
+        if model is None:
+            return Ok(self._decode(response) if response.content else None)
+        return Ok(model.model_validate(self._decode(response)))
 
-        except Exception as e:
-            return Err(e)
 
-    async def _delete(self, path: str, operation: str, headers: Dict[str, str] = {}) -> Result[bool, Exception]:
+    @_as_result
+    async def _delete(self, path: str, operation: str, headers: Optional[Dict[str, str]] = None) -> Result[bool, Exception]:
         """DELETE helper with basic logging.
 
         Args:
@@ -1052,23 +1359,6 @@ class ShieldXClient:
         Returns:
             Result with `True` if the deletion succeeded.
         """
-        try:
-            url = f"{self.base_url}{path}"
-            full_headers = {**self.headers, **headers}
-            t1 = T.time()
-
-            async with httpx.AsyncClient(headers=full_headers) as client:
-                response = await client.delete(url)
-
-            L.info({
-                "event": f"CLIENT.{operation}.RESPONSE",
-                "path": path,
-                "status": response.status_code,
-                "time": T.time() - t1
-            })
-
-            response.raise_for_status()
-            return Ok(True)
-
-        except Exception as e:
-            return Err(e)
\ No newline at end of file
+        response = await self._send("DELETE", path, operation, headers=headers)
+        response.raise_for_status()
+        return Ok(True)
@@ -1,12 +1,53 @@
 import os
+from dataclasses import dataclass
+from functools import lru_cache
+
 
 # ========================
 # Configuración de Logs
 # ========================
-LOG_PATH = os.environ.get("LOG_PATH", "/log")
-LOG_LEVEL = os.environ.get("LOG_LEVEL", "DEBUG")
-LOG_ROTATION_WHEN = os.environ.get("LOG_ROTATION_WHEN", "m")
-LOG_ROTATION_INTERVAL = int(os.environ.get("LOG_ROTATION_INTERVAL", "10"))
-LOG_TO_FILE = bool(int(os.environ.get("LOG_TO_FILE", "1")))
-LOG_ERROR_FILE = bool(int(os.environ.get("LOG_ERROR_FILE", "1")))
-SHIELDX_DEBUG = bool(int(os.environ.get("SHIELDX_DEBUG", "1")))
\ No newline at end of file
+@dataclass(frozen=True)
+class Settings:
+    """Environment-driven settings of the client.
+
+    Attributes:
+        LOG_PATH: Directory where log files are written.
+        LOG_LEVEL: Logger level name (e.g. "DEBUG", "INFO").
+        LOG_ROTATION_WHEN: `TimedRotatingFileHandler` `when` parameter.
+        LOG_ROTATION_INTERVAL: `TimedRotatingFileHandler` `interval` parameter.
+        LOG_TO_FILE: Whether to write the rotating log file.
+        LOG_ERROR_FILE: Whether to write the separate error log file.
+        SHIELDX_DEBUG: Whether the console shows every level instead of INFO/WARNING/ERROR only.
+    """
+    LOG_PATH: str
+    LOG_LEVEL: str
+    LOG_ROTATION_WHEN: str
+    LOG_ROTATION_INTERVAL: int
+    LOG_TO_FILE: bool
+    LOG_ERROR_FILE: bool
+    SHIELDX_DEBUG: bool
+
+    @classmethod
+    def from_env(cls) -> "Settings":
+        return cls(
+            LOG_PATH=os.environ.get("LOG_PATH", "/log"),
+            LOG_LEVEL=os.environ.get("LOG_LEVEL", "DEBUG"),
+            LOG_ROTATION_WHEN=os.environ.get("LOG_ROTATION_WHEN", "m"),
+            LOG_ROTATION_INTERVAL=int(os.environ.get("LOG_ROTATION_INTERVAL", "10")),
+            LOG_TO_FILE=bool(int(os.environ.get("LOG_TO_FILE", "1"))),
+            LOG_ERROR_FILE=bool(int(os.environ.get("LOG_ERROR_FILE", "1"))),
+            SHIELDX_DEBUG=bool(int(os.environ.get("SHIELDX_DEBUG", "1"))),
+        )
+
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Parse the environment once and return the shared `Settings`."""
+    return Settings.from_env()
+
+
+def __getattr__(name: str):
+    # compatibilidad: config.LOG_PATH, config.SHIELDX_DEBUG, ...
+    if name in Settings.__dataclass_fields__:
+        return getattr(get_settings(), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
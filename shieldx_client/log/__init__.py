@@ -1,14 +1,19 @@
-import os, sys, logging, json, threading
+import os, sys, logging, queue, atexit, copy, time, weakref
+import orjson
 from shieldx_client import config
-from logging.handlers import TimedRotatingFileHandler
-from option import NONE, Option
+from logging.handlers import TimedRotatingFileHandler, QueueHandler, QueueListener
+from typing import Optional
 
-LOG_PATH            = config.LOG_PATH                   
-LOG_LEVEL           = config.LOG_LEVEL
-LOG_ROTATION_WHEN   = config.LOG_ROTATION_WHEN
-LOG_ROTATION_INTERVAL = config.LOG_ROTATION_INTERVAL
-LOG_TO_FILE         = config.LOG_TO_FILE
-LOG_ERROR_FILE      = config.LOG_ERROR_FILE
+_settings           = config.get_settings()
+LOG_PATH            = _settings.LOG_PATH
+LOG_LEVEL           = _settings.LOG_LEVEL
+LOG_ROTATION_WHEN   = _settings.LOG_ROTATION_WHEN
+LOG_ROTATION_INTERVAL = _settings.LOG_ROTATION_INTERVAL
+LOG_TO_FILE         = _settings.LOG_TO_FILE
+LOG_ERROR_FILE      = _settings.LOG_ERROR_FILE
+
+# Directorios de log ya creados/verificados en este proceso
+_ensured_paths = set()
 
 
 class DumbLogger(object):
@@ -41,10 +46,37 @@ class JsonFormatter(logging.Formatter):
     """
     Custom JSON formatter for log records.
 
-    Formats each log record into a JSON object, including metadata like timestamp, log level,
-    logger name, and thread name. If the message is a dictionary, it merges it into the log record.
+    Formats each log record into a single-line JSON object, including metadata like timestamp,
+    log level, logger name, and thread name. If the message is a dictionary, it merges it into
+    the log record. Values that are not JSON serializable are written with `str()`.
     """
 
+    # (segundo, "YYYY-mm-dd HH:MM:SS") del último timestamp formateado
+    _time_cache = (None, "")
+
+    def formatTime(self, record, datefmt=None):
+        """
+        Format the record's creation time, reusing the date/time part within the same second.
+
+        Produces the same text as `logging.Formatter.formatTime` but only calls `strftime`
+        once per second; an explicit `datefmt` falls back to the base implementation.
+
+        Args:
+            record (LogRecord): The log record instance.
+            datefmt (str, optional): Explicit `strftime` format.
+
+        Returns:
+            str: The formatted timestamp.
+        """
+        if datefmt:
+            return super().formatTime(record, datefmt)
+        second = int(record.created)
+        cached_second, prefix = self._time_cache
+        if second != cached_second:
+            prefix = time.strftime(self.default_time_format, self.converter(record.created))
+            self._time_cache = (second, prefix)
+        return self.default_msec_format % (prefix, record.msecs)
+
     def format(self, record):
         """
         Format the log record as a JSON string.
@@ -55,19 +87,174 @@ class JsonFormatter(logging.Formatter):
         Returns:
             str: A JSON-formatted log string.
         """
-        thread_id = threading.current_thread().name
         log_data = {
             'timestamp': self.formatTime(record),
             'level': record.levelname,
             'logger_name': record.name,
-            "thread_name": thread_id
+            "thread_name": record.threadName
         }
-        if isinstance(record.msg, dict):
-            log_data.update(record.msg)
+        msg = record.msg
+        if isinstance(msg, dict):
+            log_data.update(msg)
+        elif type(msg) is str and not record.args:
+            # sin args no hay nada que interpolar: evita getMessage()
+            log_data['message'] = msg
         else:
             log_data['message'] = record.getMessage()
 
-        return json.dumps(log_data, indent=4) + "\n"
+        return orjson.dumps(log_data, default=str, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE).decode()
+
+
+class LevelMaskFilter(logging.Filter):
+    """
+    Filter that lets through only records whose level is in a fixed set.
+
+    The allowed levels are folded into a bitmask once, so each record costs a single shift-and-test.
+    """
+
+    def __init__(self, *levels: int):
+        """
+        Args:
+            *levels (int): Levels to accept (e.g. `logging.INFO`).
+        """
+        super().__init__()
+        self.mask = 0
+        for level in levels:
+            self.mask |= 1 << level
+
+    def filter(self, record):
+        return bool((1 << record.levelno) & self.mask)
+
+
+class DroppingQueueHandler(QueueHandler):
+    """
+    Queue handler that hands records to a `QueueListener` thread without blocking the caller.
+
+    Records are enqueued with `put_nowait`; when the bounded queue is full the record is dropped
+    instead of stalling the logging thread.
+    """
+
+    def __init__(self, q: queue.Queue):
+        super().__init__(q)
+        self.dropped = 0
+
+    def prepare(self, record):
+        """
+        Snapshot the record for the listener thread.
+
+        Unlike the default implementation, dict messages are kept as dicts so `JsonFormatter`
+        can still merge them; other messages are rendered with their args right away.
+
+        Args:
+            record (LogRecord): The log record instance.
+
+        Returns:
+            LogRecord: A shallow copy safe to format later.
+        """
+        record = copy.copy(record)
+        if not isinstance(record.msg, dict):
+            record.msg = record.getMessage()
+            record.args = None
+        return record
+
+    def enqueue(self, record):
+        """
+        Put the record on the queue, dropping it if the queue is full.
+
+        Args:
+            record (LogRecord): The prepared log record.
+        """
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+class BufferedFileMixin:
+    """
+    Mixin for file handlers that buffers writes instead of flushing after every record.
+
+    The file is opened with a `buffer_size` write buffer and records below WARNING are left in
+    it; WARNING and above flush immediately. Pair it with `FlushingQueueListener`, which flushes
+    the handlers whenever its queue runs empty.
+    """
+
+    buffer_size = 64 * 1024
+    _defer_flush = False
+
+    def _open(self):
+        return open(self.baseFilename, self.mode, buffering=self.buffer_size,
+                    encoding=self.encoding, errors=self.errors)
+
+    def emit(self, record):
+        self._defer_flush = record.levelno < logging.WARNING
+        try:
+            super().emit(record)
+        finally:
+            self._defer_flush = False
+
+    def flush(self):
+        if not self._defer_flush:
+            super().flush()
+
+
+class BufferedTimedRotatingFileHandler(BufferedFileMixin, TimedRotatingFileHandler):
+    """`TimedRotatingFileHandler` with buffered writes (see `BufferedFileMixin`)."""
+
+
+class BufferedFileHandler(BufferedFileMixin, logging.FileHandler):
+    """`FileHandler` with buffered writes (see `BufferedFileMixin`)."""
+
+
+class FlushingQueueListener(QueueListener):
+    """
+    `QueueListener` that flushes its handlers each time the queue runs empty.
+
+    Under load records accumulate in the handlers' buffers; once the producers go idle everything
+    pending is written out before the listener blocks for the next record.
+    """
+
+    def dequeue(self, block):
+        try:
+            return self.queue.get_nowait()
+        except queue.Empty:
+            for handler in self.handlers:
+                handler.flush()
+            return self.queue.get(block)
+
+
+# Formateador compartido por todos los handlers de todos los loggers
+_JSON_FORMATTER = JsonFormatter()
+
+# Loggers con listener; el hilo del listener no sobrevive a un fork()
+_queued_logs = weakref.WeakSet()
+
+
+def _flush_queued_logs():
+    """Write out buffered records before forking so the child does not inherit and repeat them."""
+    for log in list(_queued_logs):
+        if log.listener is None:
+            continue
+        for handler in log.listener.handlers:
+            handler.acquire()
+            try:
+                handler.flush()
+            finally:
+                handler.release()
+
+
+def _restart_queued_logs():
+    """Give every queued logger a fresh queue and listener thread in the forked child."""
+    for log in list(_queued_logs):
+        if log.listener is None:
+            continue
+        q = queue.Queue(maxsize=log.listener.queue.maxsize)
+        log.queue_handler.queue = q
+        log._start_listener(q, log.listener.handlers)
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(before=_flush_queued_logs, after_in_child=_restart_queued_logs)
 
 
 class Log(logging.Logger):
@@ -75,27 +262,32 @@ class Log(logging.Logger):
     Custom logger class that supports JSON formatting, stream output to console, rotating file output,
     and error-level file separation. Uses filters for log level control.
 
+    Handlers run on a background `QueueListener` thread by default, so logging calls never block
+    on console or disk I/O, and file writes are buffered until the queue runs empty.
+
     Inherits from the built-in `logging.Logger`.
     """
 
     def __init__(self,
-                formatter: logging.Formatter = JsonFormatter(),
+                formatter: logging.Formatter = _JSON_FORMATTER,
                 name: str = "shieldx",
                 level: int = getattr(logging, LOG_LEVEL.upper(), logging.DEBUG),
                 path: str = LOG_PATH,
                 disabled: bool = False,
-                console_handler_filter=lambda record: record.levelno == logging.DEBUG,
-                file_handler_filter=lambda record: record.levelno == logging.INFO,
+                console_handler_filter: logging.Filter = LevelMaskFilter(logging.DEBUG),
+                file_handler_filter: logging.Filter = LevelMaskFilter(logging.INFO),
                 console_handler_level: int = logging.DEBUG,
                 file_handler_level: int = logging.INFO,
                 error_log: bool = LOG_ERROR_FILE,
-                filename: Option[str] = NONE,
-                output_path: Option[str] = NONE,
-                error_output_path: Option[str] = NONE,
+                filename: Optional[str] = None,
+                output_path: Optional[str] = None,
+                error_output_path: Optional[str] = None,
                 create_folder: bool = True,
                 to_file: bool = LOG_TO_FILE,
                 when: str = LOG_ROTATION_WHEN,
-                interval: int = LOG_ROTATION_INTERVAL
+                interval: int = LOG_ROTATION_INTERVAL,
+                queued: bool = True,
+                queue_size: int = 10_000
                 ):
         """
         Initialize the logger with optional console and file handlers.
@@ -106,50 +298,93 @@ class Log(logging.Logger):
             level (int): Logging level for the logger.
             path (str): Directory path where logs will be stored.
             disabled (bool): If True, disables logging handlers.
-            console_handler_filter (callable): Filter for console logs.
-            file_handler_filter (callable): Filter for file logs.
+            console_handler_filter (logging.Filter | callable): Filter for console logs.
+            file_handler_filter (logging.Filter | callable): Filter for file logs.
             console_handler_level (int): Minimum level for console logs.
             file_handler_level (int): Minimum level for file logs.
             error_log (bool): Whether to enable separate error log file.
-            filename (Option[str]): Optional filename base for logs.
-            output_path (Option[str]): Path for general log output.
-            error_output_path (Option[str]): Path for error log output.
+            filename (Optional[str]): Optional filename base for logs.
+            output_path (Optional[str]): Path for general log output.
+            error_output_path (Optional[str]): Path for error log output.
             create_folder (bool): If True, creates path if it does not exist.
             to_file (bool): If True, enables file logging.
             when (str): TimedRotatingFileHandler `when` parameter (e.g., "m" for minutes).
             interval (int): TimedRotatingFileHandler `interval` parameter.
+            queued (bool): If True, handlers run on a background listener thread fed by a queue.
+            queue_size (int): Maximum pending records when `queued`; newer records are dropped when full.
         """
         super().__init__(name, level)
 
-        if not os.path.exists(path) and create_folder:
-            os.makedirs(path)
+        # compatibilidad: también se aceptan option.Option (Some(...)/NONE)
+        filename, output_path, error_output_path = (
+            v.unwrap_or(None) if hasattr(v, "unwrap_or") else v
+            for v in (filename, output_path, error_output_path)
+        )
+        base_filename = f"{path}/{filename or name}"
+
+        if create_folder and path not in _ensured_paths:
+            os.makedirs(path, exist_ok=True)
+            _ensured_paths.add(path)
 
+        self.listener = None
         if not disabled:
+            handlers = []
             # Console handler
             console_handler = logging.StreamHandler(sys.stdout)
             console_handler.setFormatter(formatter)
             console_handler.setLevel(console_handler_level)
             console_handler.addFilter(console_handler_filter)
-            self.addHandler(console_handler)
+            handlers.append(console_handler)
 
             if to_file:
                 # Rotating file handler
-                file_handler = TimedRotatingFileHandler(
-                    filename=output_path.unwrap_or(f"{path}/{filename.unwrap_or(name)}"),
+                file_handler_cls = BufferedTimedRotatingFileHandler if queued else TimedRotatingFileHandler
+                file_handler = file_handler_cls(
+                    filename=output_path or base_filename,
                     when=when,
                     interval=interval
                 )
                 file_handler.setFormatter(formatter)
                 file_handler.setLevel(file_handler_level)
                 file_handler.addFilter(file_handler_filter)
-                self.addHandler(file_handler)
+                handlers.append(file_handler)
 
             if error_log:
                 # Error file handler
-                error_file_handler = logging.FileHandler(
-                    filename=error_output_path.unwrap_or(f"{path}/{filename.unwrap_or(name)}.error")
+                error_file_handler_cls = BufferedFileHandler if queued else logging.FileHandler
+                error_file_handler = error_file_handler_cls(
+                    filename=error_output_path or f"{base_filename}.error"
                 )
                 error_file_handler.setFormatter(formatter)
                 error_file_handler.setLevel(logging.ERROR)
-                error_file_handler.addFilter(lambda record: record.levelno == logging.ERROR)
-                self.addHandler(error_file_handler)
+                error_file_handler.addFilter(LevelMaskFilter(logging.ERROR))
+                handlers.append(error_file_handler)
+
+            if queued:
+                # Los handlers reales corren en el hilo del listener
+                q = queue.Queue(maxsize=queue_size)
+                self.queue_handler = DroppingQueueHandler(q)
+                self.addHandler(self.queue_handler)
+                self._start_listener(q, handlers)
+                atexit.register(self._stop_listener)
+                _queued_logs.add(self)
+            else:
+                for handler in handlers:
+                    self.addHandler(handler)
+
+    def _start_listener(self, q: queue.Queue, handlers):
+        """
+        Start a listener thread that feeds `handlers` from `q`.
+
+        Args:
+            q (queue.Queue): Queue filled by the `DroppingQueueHandler`.
+            handlers (Iterable[logging.Handler]): Handlers that do the actual output.
+        """
+        self.listener = FlushingQueueListener(q, *handlers, respect_handler_level=True)
+        self.listener.start()
+
+    def _stop_listener(self):
+        """Drain the queue and stop the current listener (it may have been replaced after a fork)."""
+        if self.listener is not None:
+            self.listener.stop()
+            self.listener = None
@@ -1,24 +1,39 @@
 import logging
+import threading
 from shieldx_client import config
-from shieldx_client.log import Log
+from shieldx_client.log import Log, LevelMaskFilter
 
 
-SHIELDX_DEBUG = config.SHIELDX_DEBUG
+SHIELDX_DEBUG = config.get_settings().SHIELDX_DEBUG
 #SHIELDX_LOG_PATH = os.environ.get("SHIELDX_LOG_PATH", "/log")
 
 
-def console_handler_filter(lr: logging.LogRecord):
-    if SHIELDX_DEBUG:
-        return True
-    return lr.levelno in (logging.INFO, logging.ERROR, logging.WARNING)
+def _console_filter(debug: bool) -> logging.Filter:
+    """Console filter: every level (custom ones included) in debug mode, else INFO/WARNING/ERROR only."""
+    if debug:
+        return logging.Filter()
+    return LevelMaskFilter(logging.INFO, logging.ERROR, logging.WARNING)
+
+
+console_handler_filter = _console_filter(SHIELDX_DEBUG)
+
+_loggers = {}
+_loggers_lock = threading.Lock()
 
 
 def get_logger(name: str):
-    return Log(
-        name=name,
-        console_handler_filter=console_handler_filter,
-        #path=SHIELDX_LOG_PATH
-    )
+    """Return the `Log` for `name`, creating it (and its handlers) only on the first call."""
+    logger = _loggers.get(name)
+    if logger is None:
+        with _loggers_lock:
+            logger = _loggers.get(name)
+            if logger is None:
+                logger = _loggers[name] = Log(
+                    name=name,
+                    console_handler_filter=console_handler_filter,
+                    #path=SHIELDX_LOG_PATH
+                )
+    return logger
 
 # Logger genérico
 L = get_logger("shieldx")
@@ -0,0 +1,55 @@
+import asyncio
+from typing import Dict
+import pytest
+import pytest_asyncio
+from shieldx_client.client import ShieldXClient
+from shieldx_core.dtos import EventTypeCreateDTO
+
+
+BASE_URL = "http://127.0.0.1:20000/api/v1"
+EVENT_TYPES = ("EventForEvents",)
+
+
+def pytest_collection_modifyitems(config, items):
+    """Retry integration tests on transient backend/connection failures; unit tests fail hard."""
+    if not config.pluginmanager.hasplugin("rerunfailures"):
+        return
+    for item in items:
+        if item.get_closest_marker("integration") and not item.get_closest_marker("flaky"):
+            item.add_marker(pytest.mark.flaky(reruns=2, reruns_delay=0.1))
+
+
+@pytest.fixture(scope="session")
+def event_loop_policy():
+    """Run the session loop on uvloop when it is installed (not available on Windows)."""
+    try:
+        import uvloop
+    except ImportError:
+        return asyncio.DefaultEventLoopPolicy()
+    return uvloop.EventLoopPolicy()
+
+
+@pytest_asyncio.fixture(scope="session")
+async def client():
+    """One `ShieldXClient` (and connection pool) shared by the whole session."""
+    # conexiones ociosas vivas entre tests lentos
+    async with ShieldXClient(base_url=BASE_URL, keepalive_expiry=30.0) as c:
+        yield c
+
+
+@pytest_asyncio.fixture(scope="session")
+async def event_types(client) -> Dict[str, str]:
+    """Event types the event tests rely on, created once per session as `{name: event_type_id}`."""
+    results = await asyncio.gather(
+        *(client.create_event_type(EventTypeCreateDTO(event_type=name)) for name in EVENT_TYPES)
+    )
+    ids = {}
+    for name, result in zip(EVENT_TYPES, results):
+        if result.is_ok:
+            ids[name] = result.unwrap().id
+            continue
+        # puede existir de una corrida anterior
+        found = (await client.find_event_type_by_name_dict(name)).unwrap_or(None)
+        assert found, result
+        ids[name] = found["id"]
+    return ids
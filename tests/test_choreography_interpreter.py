@@ -1,10 +1,10 @@
-import pytest
 from pathlib import Path
-from shieldx_client import ShieldXClient
+import pytest
 
+pytestmark = pytest.mark.integration
 
-@pytest.mark.asyncio
-async def test_interpret_choreography_real_yaml():
+
+async def test_interpret_choreography_real_yaml(client):
     """
     Prueba el intérprete usando un YAML real desde el disco.
     """
@@ -12,8 +12,6 @@ async def test_interpret_choreography_real_yaml():
     yaml_path = Path(__file__).parent.parent / "triggers.yml"
     assert yaml_path.exists(), f"No se encontró el archivo {yaml_path}"
 
-    client = ShieldXClient(base_url="http://localhost:20000/api/v1")
-
     result = await client.interpret_async(str(yaml_path))
 
     assert result.is_ok, f"interpret_async() falló: {result.unwrap_err()}"
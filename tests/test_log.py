@@ -0,0 +1,49 @@
+import os
+import logging
+import pytest
+from shieldx_client.log import Log
+from shieldx_client.log.logger_config import _console_filter
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="requires os.fork")
+def test_forked_child_gets_a_listener(tmp_path):
+    log = Log(name="test_fork", path=str(tmp_path), to_file=True, error_log=False)
+    handlers = log.listener.handlers
+    log.info("from-parent")
+
+    pid = os.fork()
+    if pid == 0:
+        code = 1
+        try:
+            log.info("from-child")
+            log._stop_listener()
+            for handler in handlers:
+                handler.flush()
+            code = 0
+        finally:
+            os._exit(code)
+
+    _, status = os.waitpid(pid, 0)
+    log._stop_listener()
+    for handler in handlers:
+        handler.flush()
+
+    assert os.waitstatus_to_exitcode(status) == 0
+    lines = (tmp_path / "test_fork").read_text().splitlines()
+    assert sum('"from-parent"' in line for line in lines) == 1
+    assert sum('"from-child"' in line for line in lines) == 1
+
+
+@pytest.mark.parametrize("levelno", [logging.DEBUG, 15, logging.INFO, 25, logging.CRITICAL])
+def test_debug_console_filter_passes_every_level(levelno):
+    record = logging.LogRecord("test", levelno, __file__, 0, "msg", None, None)
+    assert _console_filter(True).filter(record)
+
+
+def test_console_filter_keeps_standard_levels_only():
+    console_filter = _console_filter(False)
+    passed = [
+        levelno for levelno in (logging.DEBUG, 15, logging.INFO, 25, logging.WARNING, logging.ERROR, logging.CRITICAL)
+        if console_filter.filter(logging.LogRecord("test", levelno, __file__, 0, "msg", None, None))
+    ]
+    assert passed == [logging.INFO, logging.WARNING, logging.ERROR]
@@ -0,0 +1,330 @@
+import asyncio
+import itertools
+import secrets
+import pytest
+from shieldx_core.dtos import (TriggerCreateDTO, MessageWithIDDTO, EventTypeCreateDTO, EventCreateDTO, 
+                                RuleCreateDTO, RuleUpdateDTO, TriggerUpdateDTO, EventUpdateDTO)
+
+# todas estas pruebas requieren el backend de ShieldX en localhost:20000
+pytestmark = pytest.mark.integration
+
+
+_RULE_PARAMS = {
+    "bucket_id": {"type": "string", "description": "ID del bucket"},
+    "key": {"type": "string", "description": "Llave"},
+    "sink_path": {"type": "string", "description": "Ruta destino"}
+}
+# validada una sola vez; _rule() la copia con otro target
+_MICTLANX_RULE = RuleCreateDTO(target="mictlanx.get", parameters=_RULE_PARAMS)
+_UPDATED_RULE = RuleUpdateDTO(target="updated_function", parameters=_RULE_PARAMS)
+_DELETE_RULE = RuleCreateDTO(
+    target="to_be_deleted",
+    parameters={"x": {"type": "bool", "description": "to be removed"}}
+)
+
+
+def _rule(target: str = "mictlanx.get") -> RuleCreateDTO:
+    return _MICTLANX_RULE.model_copy(update={"target": target})
+
+
+# evento base validado una sola vez; _event() solo cambia el payload.
+# El tipo lo crea el fixture event_types.
+_BASE_EVENT = EventCreateDTO(service_id="s1", microservice_id="m1", function_id="f1",
+                             event_type="EventForEvents", payload={})
+
+
+def _event(payload: dict) -> EventCreateDTO:
+    return _BASE_EVENT.model_copy(update={"payload": payload})
+
+
+# token aleatorio por proceso (corrida/worker) + contador: nombres únicos sin urandom por id
+_RUN_TOKEN = secrets.token_hex(8)
+_SEQ = itertools.count()
+
+
+def _id(prefix: str) -> str:
+    return f"{prefix}-{_RUN_TOKEN}-{next(_SEQ)}"
+
+
+# trigger sin regla; _trigger() solo le pone un nombre único
+_TRIGGER = TriggerCreateDTO.model_construct(name="")
+
+
+def _trigger(prefix: str) -> TriggerCreateDTO:
+    return _TRIGGER.model_copy(update={"name": _id(prefix)})
+
+
+def ok(result):
+    """Unwrap an Ok result; an Err fails the test showing the error."""
+    assert result.is_ok, result
+    return result.unwrap()
+
+#@pytest.mark.skip("")
+async def test_create_event_type(client):
+    created = ok(await client.create_event_type(EventTypeCreateDTO.model_construct(event_type="TestEventType")))
+    assert created.id
+
+#@pytest.mark.skip("")
+async def test_list_event_types(client):
+    event_type = await client.list_event_types()
+    assert event_type.is_ok
+
+    # assert event_type.event_type_id
+
+#@pytest.mark.skip("")
+async def test_get_event_type_by_id(client):
+    created_event_type = ok(await client.create_event_type(EventTypeCreateDTO.model_construct(event_type="TestEventType")))
+
+    # ✅ Usa el atributo correcto `id`
+    fetched_event_type = ok(await client.get_event_type_by_id(created_event_type.id))
+
+    # Validaciones
+    assert fetched_event_type.event_type == "TestEventType"
+    assert fetched_event_type.event_type_id == created_event_type.id
+
+#@pytest.mark.skip("")
+async def test_delete_event_type(client):
+    # Crear un tipo de evento para eliminar
+    created_event = ok(await client.create_event_type(EventTypeCreateDTO.model_construct(event_type="EventToDelete")))
+    event_type_id = created_event.id
+
+    # Eliminar el tipo de evento
+    deletion_result = await client.delete_event_type(event_type_id)
+    assert deletion_result.is_ok
+
+    # Verificar que ya no existe
+    fetch_result = await client.get_event_type_by_id(event_type_id)
+    assert fetch_result.is_err  # Debería fallar porque ya fue eliminado
+
+#@pytest.mark.skip("")
+@pytest.mark.usefixtures("event_types")
+async def test_create_Event(client):
+    event = _event({"test": True})
+    dto = ok(await client.create_event(event))
+    assert dto.message == "Evento creado exitosamente"
+    assert dto.id is not None  # ✅ CAMBIO AQUÍ
+
+#@pytest.mark.skip("")
+async def test_all_Events(client):
+    all_events = await client.get_all_events()
+    assert all_events.is_ok
+
+#@pytest.mark.skip("")
+async def test_get_events_by_service(client):
+    result = await client.get_events_by_service("s1")
+    events = result.unwrap_or(None)
+    assert isinstance(events, list), result
+
+async def test_count_events_by_service(client):
+    # otros tests (o workers de xdist) pueden crear eventos de s1 entre llamadas
+    before = ok(await client.count_events_by_service("s1"))
+    events = ok(await client.get_events_by_service("s1"))
+    after = ok(await client.count_events_by_service("s1"))
+    assert before <= len(events) <= after
+
+#@pytest.mark.skip("")
+async def test_get_events_by_service_pat(client):
+    result =await client.get_events_by_service_path("s1")
+    events = result.unwrap_or(None)
+    assert isinstance(events, list), result
+
+async def test_get_events_by_microservice(client):
+    result =await client.get_events_by_microservice("m1")
+    events = result.unwrap_or(None)
+    assert isinstance(events, list), result
+
+@pytest.mark.usefixtures("event_types")
+async def test_get_event_by_id(client):
+    # Crear evento
+    event = _event({"key": "value"})
+    created_event = ok(await client.create_event(event))
+    event_id = created_event.id
+
+    # Obtener el evento por ID
+    fetched_event = ok(await client.get_event_by_id(event_id))
+    assert fetched_event.event_id == event_id
+    assert fetched_event.service_id == "s1"
+    assert fetched_event.payload == {"key": "value"}
+
+#@pytest.mark.skip("")
+async def test_get_events_by_function(client):
+    result =await client.get_events_by_function("f1")
+    events = result.unwrap_or(None)
+    assert isinstance(events, list), result
+
+#@pytest.mark.skip("")
+@pytest.mark.usefixtures("event_types")
+async def test_update_event(client):
+    # Crear evento inicial
+    event = _event({"old_key": "old_value"})
+    # Extraer el ID del evento recién creado
+    created = ok(await client.create_event(event))
+    event_id = created.id
+
+    # Paso 3: Actualizar el evento
+    update_data = EventUpdateDTO.model_construct(payload={"new_key": "new_value"})
+    updated = ok(await client.update_event(event_id, update_data))
+    assert updated.payload == {"new_key": "new_value"}
+
+#@pytest.mark.skip("")
+@pytest.mark.usefixtures("event_types")
+async def test_delete_event(client):
+    # Crear evento inicial
+    event = _event({"test": True})
+    created_event = ok(await client.create_event(event))
+
+
+    # Eliminar evento
+    delete_result = await client.delete_event(created_event.id)
+    assert delete_result.is_ok
+
+#@pytest.mark.skip("")
+async def test_create_rule(client):
+    rule = _rule()
+    result = await client.create_rule(rule)
+    assert result.is_ok
+
+#@pytest.mark.skip("")
+async def test_get_rule_by_id(client):
+    rule = _rule()
+    rule_id = ok(await client.create_rule(rule))
+
+    fetched = ok(await client.get_rule_by_id(rule_id.id))
+    assert fetched.rule_id == rule_id.id
+    assert fetched.target == "mictlanx.get"
+
+#@pytest.mark.skip("")
+async def test_list_rules(client):
+    rules = ok(await client.list_rules())
+    assert isinstance(rules, list)
+    
+#@pytest.mark.skip("")
+async def test_update_rule(client):
+    rule = _rule("original_function")
+    rule_id = ok(await client.create_rule(rule)).id
+    msg = ok(await client.update_rule(rule_id, _UPDATED_RULE))
+    assert msg.message == "Rule updated"
+    
+#@pytest.mark.skip("")
+async def test_delete_rule(client):
+    rule_id = ok(await client.create_rule(_DELETE_RULE))
+
+    assert ok(await client.delete_rule(rule_id.id)) is True
+
+
+#@pytest.mark.skip("")
+async def test_create_trigger(client):
+    trigger = TriggerCreateDTO.model_construct(
+        name=_id("test_trigger_create"),
+        rule=_rule()
+    )
+    result = await client.create_trigger(trigger)
+    assert result.is_ok
+
+#@pytest.mark.skip("")
+async def test_get_trigger_by_name(client):
+    name = _id("test_trigger_get")
+    trigger = TriggerCreateDTO.model_construct(
+        name=name,
+        rule=_rule()
+    )
+    created = await client.create_trigger(trigger)
+    assert created.is_ok
+
+    fetched = ok(await client.get_trigger_by_name(name))
+    assert fetched.name == name
+
+#@pytest.mark.skip("")
+async def test_list_triggers(client):
+    result = await client.get_all_triggers()
+    assert result.is_ok
+
+
+#@pytest.mark.skip("")
+async def test_update_trigger(client):
+    name = _id("test_trigger_update")
+    trigger = TriggerCreateDTO.model_construct(
+        name=name,
+        rule=_rule("original_function")
+    )
+    created = await client.create_trigger(trigger)
+    assert created.is_ok
+
+    updated_trigger = TriggerUpdateDTO.model_construct(
+        name=name,
+        rule=_UPDATED_RULE
+    )
+    updated = ok(await client.update_trigger(name, updated_trigger))
+    assert updated.id
+
+#@pytest.mark.skip("")
+async def test_delete_trigger(client):
+    name = _id("test_trigger_delete")
+    trigger = TriggerCreateDTO.model_construct(
+        name=name,
+        rule=_DELETE_RULE
+    )
+    created = await client.create_trigger(trigger)
+    assert created.is_ok
+
+    assert ok(await client.delete_trigger(name)) is True
+
+# (id, crear A, crear B, enlazar, consultas intermedias, desenlazar); a y b son los ids creados
+LINK_CASES = [
+    (
+        "event_type-trigger",
+        lambda c: c.create_event_type(EventTypeCreateDTO.model_construct(event_type="TestEventType")),
+        lambda c: c.create_trigger(_trigger("trigger_id")),
+        lambda c, a, b: c.link_trigger_to_event_type(a, b),
+        [
+            lambda c, a, b: c.list_triggers_for_event_type(a),
+            lambda c, a, b: c.replace_triggers_for_event_type(a, [b]),
+        ],
+        lambda c, a, b: c.unlink_trigger_from_event_type(a, b),
+    ),
+    (
+        "rule-trigger",
+        lambda c: c.create_rule(_rule()),
+        lambda c: c.create_trigger(_trigger("trigger_id")),
+        lambda c, a, b: c.link_rule_to_trigger(b, a),
+        [
+            lambda c, a, b: c.list_rules_for_trigger(b),
+            lambda c, a, b: c.create_and_link_rule(b, _rule()),
+        ],
+        lambda c, a, b: c.unlink_rule_from_trigger(b, a),
+    ),
+    (
+        "trigger-trigger",
+        lambda c: c.create_trigger(_trigger("ParentTrigger")),
+        lambda c: c.create_trigger(_trigger("ChildTrigger")),
+        lambda c, a, b: c.link_trigger_child(a, b),
+        [
+            lambda c, a, b: c.list_trigger_children(b),
+            lambda c, a, b: c.list_trigger_parents(a),
+        ],
+        lambda c, a, b: c.unlink_trigger_child(a, b),
+    ),
+]
+
+
+#@pytest.mark.skip("")
+@pytest.mark.parametrize("case", LINK_CASES, ids=lambda case: case[0])
+async def test_pair_link(client, case):
+    _, create_a, create_b, link, checks, unlink = case
+
+    a_result, b_result = await asyncio.gather(create_a(client), create_b(client))
+    a_dto = ok(a_result)
+    b_dto = ok(b_result)
+    assert isinstance(a_dto, MessageWithIDDTO)
+    assert isinstance(b_dto, MessageWithIDDTO)
+    a_id, b_id = a_dto.id, b_dto.id
+
+    link_result = await link(client, a_id, b_id)
+    assert link_result.is_ok
+
+    for check in checks:
+        check_result = await check(client, a_id, b_id)
+        assert check_result.is_ok
+
+    unlink_result = await unlink(client, a_id, b_id)
+    assert unlink_result.is_ok
@@ -0,0 +1,346 @@
+import asyncio
+import warnings
+import httpx
+import pytest
+import orjson
+from shieldx_client.client import ShieldXClient
+from shieldx_core.dtos import EventTypeCreateDTO
+
+
+BASE_URL = "http://shieldx.test/api/v1"
+
+EVENT_TYPES = [
+    {"event_type_id": "et-1", "event_type": "TestEventType"},
+    {"event_type_id": "et-2", "event_type": "OtherEventType"},
+]
+
+
+def _event_body(event_id: str) -> dict:
+    return {"event_id": event_id, "service_id": "s1", "microservice_id": "m1",
+            "function_id": "f1", "event_type": "TestEventType", "payload": {}}
+
+
+def _client(handler, **kwargs) -> ShieldXClient:
+    """`ShieldXClient` whose requests are answered by `handler` instead of the network."""
+    return ShieldXClient(base_url=BASE_URL, transport=httpx.MockTransport(handler), **kwargs)
+
+
+async def test_create_event_type_posts_json_body():
+    seen = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request)
+        return httpx.Response(200, json={"message": "created", "id": "et-1"})
+
+    async with _client(handler) as client:
+        result = await client.create_event_type(EventTypeCreateDTO(event_type="TestEventType"))
+
+    assert result.is_ok
+    assert result.unwrap().id == "et-1"
+    assert seen[0].method == "POST"
+    assert seen[0].url.path == "/api/v1/event-types"
+    assert orjson.loads(seen[0].content) == {"event_type": "TestEventType"}
+
+
+async def test_list_event_types():
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json=EVENT_TYPES)
+
+    async with _client(handler) as client:
+        result = await client.list_event_types()
+
+    assert result.is_ok
+    assert [et.event_type_id for et in result.unwrap()] == ["et-1", "et-2"]
+
+
+async def test_get_events_by_service_sends_query_param():
+    seen = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request)
+        return httpx.Response(200, json=[])
+
+    async with _client(handler) as client:
+        result = await client.get_events_by_service("svc/1 a")
+
+    assert result.is_ok
+    assert result.unwrap() == []
+    assert seen[0].url.params["service_id"] == "svc/1 a"
+
+
+async def test_count_rules_skips_validation():
+    def handler(request: httpx.Request) -> httpx.Response:
+        # elementos que no validarían como RuleResponseDTO
+        return httpx.Response(200, json=[{"unexpected": i} for i in range(3)])
+
+    async with _client(handler) as client:
+        result = await client.count_rules()
+
+    assert result.is_ok
+    assert result.unwrap() == 3
+
+
+async def test_count_rejects_non_list_body():
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json={"detail": "unexpected", "a": 1})
+
+    async with _client(handler) as client:
+        rules = await client.count_rules()
+        events = await client.count_events_by_service("s1")
+
+    assert rules.is_err and isinstance(rules.unwrap_err(), TypeError)
+    assert events.is_err and isinstance(events.unwrap_err(), TypeError)
+
+
+async def test_http_error_is_err():
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(404, json={"detail": "Not found"})
+
+    async with _client(handler) as client:
+        result = await client.get_event_type_by_id("missing")
+
+    assert result.is_err
+    assert isinstance(result.unwrap_err(), httpx.HTTPStatusError)
+
+
+async def test_empty_id_is_rejected_without_request():
+    seen = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request)
+        return httpx.Response(200, json={})
+
+    async with _client(handler) as client:
+        result = await client.get_rule_by_id(" ")
+
+    assert result.is_err
+    assert isinstance(result.unwrap_err(), ValueError)
+    assert seen == []
+
+
+async def test_token_sets_authorization_header():
+    seen = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request)
+        return httpx.Response(200, json=EVENT_TYPES)
+
+    async with _client(handler, token="secret") as client:
+        await client.list_event_types()
+
+    assert seen[0].headers["Authorization"] == "Bearer secret"
+
+
+async def test_cached_get_is_served_without_request():
+    seen = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request)
+        return httpx.Response(200, json=EVENT_TYPES)
+
+    async with _client(handler, cache_ttl=60) as client:
+        first = await client.list_event_types()
+        second = await client.list_event_types()
+
+    assert first.is_ok and second.is_ok
+    assert second.unwrap() == first.unwrap()
+    assert len(seen) == 1
+
+
+async def test_write_invalidates_cache():
+    gets = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.method == "POST":
+            return httpx.Response(200, json={"message": "created", "id": "et-3"})
+        gets.append(request)
+        return httpx.Response(200, json=EVENT_TYPES[:len(gets)])
+
+    async with _client(handler, cache_ttl=60) as client:
+        first = await client.list_event_types()
+        await client.create_event_type(EventTypeCreateDTO(event_type="Another"))
+        second = await client.list_event_types()
+
+    assert len(gets) == 2
+    assert len(first.unwrap()) == 1
+    assert len(second.unwrap()) == 2
+
+
+async def test_get_in_flight_during_write_is_not_cached():
+    gets = []
+    release = asyncio.Event()
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        if request.method == "POST":
+            return httpx.Response(200, json={"message": "created", "id": "et-3"})
+        gets.append(request)
+        if len(gets) == 1:
+            # la respuesta llega después del POST
+            await release.wait()
+        return httpx.Response(200, json=EVENT_TYPES[:len(gets)])
+
+    async with _client(handler, cache_ttl=60) as client:
+        stale = asyncio.create_task(client.list_event_types())
+        while not gets:
+            await asyncio.sleep(0)
+        await client.create_event_type(EventTypeCreateDTO(event_type="Another"))
+        release.set()
+        await stale
+        fresh = await client.list_event_types()
+
+    assert len(gets) == 2
+    assert len(fresh.unwrap()) == 2
+
+
+async def test_stale_entry_is_revalidated_with_etag():
+    seen = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request)
+        if request.headers.get("If-None-Match") == '"v1"':
+            return httpx.Response(304, headers={"ETag": '"v1"', "Cache-Control": "no-cache"})
+        return httpx.Response(200, json=EVENT_TYPES, headers={"ETag": '"v1"', "Cache-Control": "no-cache"})
+
+    async with _client(handler, cache_ttl=60) as client:
+        first = await client.list_event_types()
+        second = await client.list_event_types()
+
+    assert len(seen) == 2
+    assert "If-None-Match" not in seen[0].headers
+    assert seen[1].headers["If-None-Match"] == '"v1"'
+    assert second.unwrap() == first.unwrap()
+
+
+async def test_get_events_bulk_keeps_input_order():
+    async def handler(request: httpx.Request) -> httpx.Response:
+        event_id = request.url.path.rsplit("/", 1)[-1]
+        # el primero responde al final
+        await asyncio.sleep(0.02 if event_id == "ev-1" else 0)
+        return httpx.Response(200, json=_event_body(event_id))
+
+    async with _client(handler) as client:
+        result = await client.get_events_bulk(["ev-1", "ev-2", "ev-3"])
+
+    assert result.is_ok
+    assert [e.event_id for e in result.unwrap()] == ["ev-1", "ev-2", "ev-3"]
+
+
+async def test_get_events_bulk_returns_first_error():
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path.endswith("/missing"):
+            return httpx.Response(404, json={"detail": "Not found"})
+        return httpx.Response(200, json=_event_body(request.url.path.rsplit("/", 1)[-1]))
+
+    async with _client(handler) as client:
+        result = await client.get_events_bulk(["ev-1", "missing", "ev-3"])
+
+    assert result.is_err
+    assert result.unwrap_err().response.status_code == 404
+
+
+async def test_list_event_types_with_triggers_pairs_triggers():
+    async def handler(request: httpx.Request) -> httpx.Response:
+        path = request.url.path
+        if path == "/api/v1/event-types":
+            return httpx.Response(200, json=EVENT_TYPES)
+        event_type_id = path.split("/")[-2]
+        # et-1 responde después de et-2
+        await asyncio.sleep(0.02 if event_type_id == "et-1" else 0)
+        return httpx.Response(200, json=[
+            {"event_type_id": event_type_id, "trigger_id": f"{event_type_id}-t{i}"} for i in range(2)
+        ])
+
+    async with _client(handler) as client:
+        result = await client.list_event_types_with_triggers()
+
+    assert result.is_ok
+    fused = result.unwrap()
+    assert [item["event_type"].event_type_id for item in fused] == ["et-1", "et-2"]
+    for item in fused:
+        event_type_id = item["event_type"].event_type_id
+        assert [t.trigger_id for t in item["triggers"]] == [f"{event_type_id}-t0", f"{event_type_id}-t1"]
+
+
+async def test_list_event_types_with_triggers_returns_first_error():
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/api/v1/event-types":
+            return httpx.Response(200, json=EVENT_TYPES)
+        if request.url.path == "/api/v1/event-types/et-2/triggers":
+            return httpx.Response(404, json={"detail": "Not found"})
+        return httpx.Response(200, json=[])
+
+    async with _client(handler) as client:
+        result = await client.list_event_types_with_triggers()
+
+    assert result.is_err
+    assert result.unwrap_err().response.status_code == 404
+
+
+async def test_link_batch_returns_first_error():
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path.endswith("/triggers/bad"):
+            return httpx.Response(500, json={"detail": "boom"})
+        return httpx.Response(200, json={"message": "linked"})
+
+    async with _client(handler) as client:
+        linked = await client.link_triggers_to_event_type("et-1", ["t-1", "t-2"])
+        failed = await client.link_triggers_to_event_type("et-1", ["t-1", "bad", "t-2"], batch_size=2)
+
+    assert linked.is_ok and linked.unwrap() is True
+    assert failed.is_err
+    assert isinstance(failed.unwrap_err(), httpx.HTTPStatusError)
+    assert failed.unwrap_err().response.status_code == 500
+
+
+async def test_link_accepts_empty_body():
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(204)
+
+    async with _client(handler) as client:
+        result = await client.link_rule_to_trigger("t-1", "r-1")
+
+    assert result.is_ok and result.unwrap() is True
+
+
+async def test_failed_unlink_is_err():
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(404, json={"detail": "Not found"})
+
+    async with _client(handler) as client:
+        result = await client.unlink_rule_from_trigger("t-1", "r-1")
+
+    assert result.is_err
+    assert isinstance(result.unwrap_err(), httpx.HTTPStatusError)
+    assert result.unwrap_err().response.status_code == 404
+
+
+def test_new_loop_without_aclose_warns():
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json=EVENT_TYPES)
+
+    client = _client(handler)
+    asyncio.run(client.list_event_types())
+    with pytest.warns(ResourceWarning, match="aclose"):
+        result = asyncio.run(client.list_event_types())
+    asyncio.run(client.aclose())
+
+    assert result.is_ok
+
+
+def test_new_loop_after_aclose_does_not_warn():
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json=EVENT_TYPES)
+
+    async def list_and_close(client: ShieldXClient):
+        try:
+            return await client.list_event_types()
+        finally:
+            await client.aclose()
+
+    client = _client(handler)
+    asyncio.run(list_and_close(client))
+    with warnings.catch_warnings():
+        warnings.simplefilter("error", ResourceWarning)
+        result = asyncio.run(list_and_close(client))
+
+    assert result.is_ok